@@ -13,6 +13,7 @@
 # =======================================================================================
 
 import os
+from types import MappingProxyType
 from dotenv import load_dotenv
 import logging
 
@@ -107,6 +108,8 @@ class Settings:
         "sound_notification": True,
         "desktop_notification": True
     }
+    # Salt okunur görünüm - yalnızca okunacaksa .copy() yerine bu kullanılır
+    DEFAULT_NOTIFICATION_SETTINGS_RO = MappingProxyType(DEFAULT_NOTIFICATION_SETTINGS)
     
     # ==================== OLAY AYARLARI ====================
     # Düşme tespiti için ayarlar
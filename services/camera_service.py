@@ -346,6 +346,20 @@ class CameraService:
         self.is_detecting = False
         logging.info("Düşme tespiti durduruldu")
     
+    def __enter__(self):
+        """Context manager girişi"""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, tb):
+        """Tespiti ve yakalamayı durdurur - zaten durmuşsa etkisizdir"""
+        # Biri hata verse bile diğer durdurma adımı mutlaka çalışır
+        for stop_fn in (self.stop_detection, self.stop_capture):
+            try:
+                stop_fn()
+            except Exception:
+                logging.exception(f"{stop_fn.__name__} başarısız")
+        return False
+    
     def get_current_frame(self) -> Optional[np.ndarray]:
         """Mevcut frame'i döndürür"""
         with self.frame_lock:
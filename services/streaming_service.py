@@ -219,6 +219,15 @@ class StreamingService:
         except Exception as e:
             logging.error(f"Streaming durdurulurken hata: {str(e)}")
     
+    def __enter__(self):
+        """Context manager girişi"""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, tb):
+        """Streaming'i durdurur - zaten durmuşsa etkisizdir"""
+        self.stop_streaming()
+        return False
+    
     def _frame_update_loop(self):
         """Frame güncelleme döngüsü"""
         try:
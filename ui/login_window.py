@@ -162,7 +162,7 @@ class LoginWindow:
             g = int(62 + (246 - 62) * t)
             b = int(80 + (245 - 80) * t)
             color = f'#{r:02x}{g:02x}{b:02x}'
-            self.canvas.create_line(0, i, 600, i, fill=color)
+            self.canvas.create_rectangle(0, i, 600, i + 1, fill=color, outline='', width=0)
         
         # Ana frame
         main_frame = ttk.Frame(self.canvas, padding="40", style='Main.TFrame')
@@ -25,6 +25,7 @@ import logging
 from typing import Dict, Optional
 import webbrowser
 import os
+import contextlib
 
 from config.settings import Settings
 from services.camera_service import get_camera_service, initialize_camera_service
@@ -35,6 +36,10 @@ from services.notification_service import get_notification_service
 class MainWindow:
     """Ana uygulama penceresi sınıfı"""
     
+    # Periyodik güncelleme zamanlayıcısı
+    TICK_MS = 33  # ~30 FPS video güncellemesi
+    STATS_EVERY_TICKS = 5000 // TICK_MS  # ~5 saniyede bir istatistik güncellemesi
+    
     def __init__(self, user_data: Dict, root: tk.Tk = None):
         """Ana pencereyi başlatır"""
         self.user_data = user_data
@@ -59,6 +64,11 @@ class MainWindow:
         self.database_service = get_database_service()
         self.notification_service = get_notification_service()
         
+        # Servis yaşam döngüsü - kapanışta ters sırada koşulsuz durdurulur
+        self._stack = contextlib.ExitStack()
+        self._stack.enter_context(self.camera_service)
+        self._stack.enter_context(self.streaming_service)
+        
         # UI kontrol değişkenleri
         self.is_camera_running = tk.BooleanVar(value=False)
         self.is_detection_active = tk.BooleanVar(value=False)
@@ -71,9 +81,13 @@ class MainWindow:
         self.test_button = None
         self.stats_frame = None
         
-        # Video güncelleme
-        self.video_update_job = None
-        self.stats_update_job = None
+        # Periyodik güncelleme (video + istatistik tek zamanlayıcıda)
+        self._tick_job = None
+        self._tick_n = 0
+        self._closed = False
+        
+        # Paylaşılan root'ta sahibin önceki kapatma komutu (kapanış ona devredilir)
+        self._owner_close_cmd = ''
         
         # İstatistikler
         self.total_detections = 0
@@ -108,11 +122,17 @@ class MainWindow:
         # Callback'leri ayarla
         self._setup_callbacks()
         
-        # Pencere kapatma olayı
+        # Pencere kapatma olayı - paylaşılan root'ta sahibin komutu saklanır
+        if not self.owns_root:
+            self._owner_close_cmd = self.root.protocol("WM_DELETE_WINDOW")
+            self.root.bind('<Destroy>', self._on_root_destroy, add='+')
         self.root.protocol("WM_DELETE_WINDOW", self._on_window_close)
         
-        # İlk durumu ayarla
-        self._update_stats()
+        # Yer tutucu görüntü - PIL/Tk görüntü altyapısını pencere yüklenirken ısıtır,
+        # böylece kamera başlatıldığında ilk frame takılma yapmaz
+        self._tk_photo = ImageTk.PhotoImage(Image.new('RGB', (640, 480), (16, 16, 16)))
+        self.video_label.config(image=self._tk_photo, compound=tk.CENTER, foreground='#cccccc')
+        self.video_label.image = self._tk_photo
     
     def _center_window(self):
         """Pencereyi ekranın ortasında konumlandırır"""
@@ -364,8 +384,8 @@ class MainWindow:
                     self.test_button.config(state='normal')
                     self._update_status("Kamera başlatıldı", "green")
                     
-                    # Video güncelleme döngüsünü başlat
-                    self._start_video_update()
+                    # Boşta bekleyen yavaş tick yerine video hızında tick'e hemen geç
+                    self._restart_tick()
                 else:
                     messagebox.showerror("Hata", "Kamera başlatılamadı!")
             else:
@@ -386,10 +406,10 @@ class MainWindow:
                     self._toggle_streaming()
                 
                 self._update_status("Kamera durduruldu", "orange")
-                self._stop_video_update()
                 
                 # Video etiketi sıfırla
-                self.video_label.config(image='', text="Kamera bağlantısı kesildi")
+                self.video_label.config(image=self._tk_photo, text="Kamera bağlantısı kesildi")
+                self.video_label.image = self._tk_photo
                 
         except Exception as e:
             logging.error(f"Kamera toggle hatası: {str(e)}")
@@ -567,7 +587,8 @@ class MainWindow:
         """Ayarlar penceresini açar"""
         try:
             from ui.settings_window import SettingsWindow
-            settings_window = SettingsWindow(self.root, self.user_data, self._on_settings_updated)
+            with SettingsWindow(self.root, self.user_data, self._on_settings_updated) as settings_window:
+                self.root.wait_window(settings_window.window)
             
         except Exception as e:
             logging.error(f"Settings penceresi açma hatası: {str(e)}")
@@ -587,54 +608,77 @@ class MainWindow:
         if response:
             self._cleanup_and_close()
     
-    def _start_video_update(self):
-        """Video güncelleme döngüsünü başlatır"""
-        self._update_video_frame()
+    def _start_tick(self):
+        """Periyodik güncelleme zamanlayıcısını başlatır"""
+        if self._tick_job is None:
+            self._tick()
+    
+    def _restart_tick(self):
+        """Bekleyen tick'i iptal edip zamanlayıcıyı hemen yeniden başlatır (kamera açıldığında)"""
+        if self._tick_job is not None:
+            self.root.after_cancel(self._tick_job)
+            self._tick_job = None
+        self._tick()
     
-    def _stop_video_update(self):
-        """Video güncelleme döngüsünü durdurur"""
-        if self.video_update_job:
-            self.root.after_cancel(self.video_update_job)
-            self.video_update_job = None
+    def _tick(self):
+        """Video'yu her tick'te, istatistikleri her STATS_EVERY_TICKS tick'te günceller"""
+        if self.is_camera_running.get():
+            self._update_video_frame()
+            
+            if self._tick_n % self.STATS_EVERY_TICKS == 0:
+                self._update_stats()
+            self._tick_n += 1
+            delay = self.TICK_MS
+        else:
+            # Kamera kapalıyken yalnızca istatistikler; pencere ~5 saniyede bir uyanır
+            self._update_stats()
+            self._tick_n = 1
+            delay = self.TICK_MS * self.STATS_EVERY_TICKS
+        
+        self._tick_job = self.root.after(delay, self._tick)
     
     def _update_video_frame(self):
         """Video frame'ini günceller"""
+        # Sık kullanılan nesneleri yerel isimlere bağla (~30 FPS'te her frame'de attribute aramasını önler)
+        video_label = self.video_label
+        _get_frame = self.camera_service.get_processed_frame
+        _cvt = cv2.cvtColor
+        _resize = cv2.resize
+        _cfg = video_label.config
+        
         try:
-            if self.is_camera_running.get():
-                frame = self.camera_service.get_processed_frame()
+            frame = _get_frame()
+            
+            if frame is not None:
+                # Frame'i tkinter için dönüştür
+                frame_rgb = _cvt(frame, cv2.COLOR_BGR2RGB)
+                
+                # Boyutları video label'a göre ayarla
+                label_width = video_label.winfo_width()
+                label_height = video_label.winfo_height()
                 
-                if frame is not None:
-                    # Frame'i tkinter için dönüştür
-                    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                if label_width > 1 and label_height > 1:
+                    # Oranı koruyarak yeniden boyutlandır
+                    frame_h, frame_w = frame_rgb.shape[:2]
+                    aspect_ratio = frame_w / frame_h
                     
-                    # Boyutları video label'a göre ayarla
-                    label_width = self.video_label.winfo_width()
-                    label_height = self.video_label.winfo_height()
+                    if label_width / label_height > aspect_ratio:
+                        new_height = label_height - 20
+                        new_width = int(new_height * aspect_ratio)
+                    else:
+                        new_width = label_width - 20
+                        new_height = int(new_width / aspect_ratio)
                     
-                    if label_width > 1 and label_height > 1:
-                        # Oranı koruyarak yeniden boyutlandır
-                        aspect_ratio = frame_rgb.shape[1] / frame_rgb.shape[0]
-                        
-                        if label_width / label_height > aspect_ratio:
-                            new_height = label_height - 20
-                            new_width = int(new_height * aspect_ratio)
-                        else:
-                            new_width = label_width - 20
-                            new_height = int(new_width / aspect_ratio)
-                        
-                        frame_resized = cv2.resize(frame_rgb, (new_width, new_height))
-                        
-                        # PIL Image'e çevir
-                        image = Image.fromarray(frame_resized)
-                        photo = ImageTk.PhotoImage(image)
-                        
-                        # Label'ı güncelle
-                        self.video_label.config(image=photo, text="")
-                        self.video_label.image = photo  # Referansı sakla
-                
-                # Bir sonraki güncelleme için zamanlayıcı ayarla
-                self.video_update_job = self.root.after(33, self._update_video_frame)  # ~30 FPS
-                
+                    frame_resized = _resize(frame_rgb, (new_width, new_height))
+                    
+                    # PIL Image'e çevir
+                    image = Image.fromarray(frame_resized)
+                    photo = ImageTk.PhotoImage(image)
+                    
+                    # Label'ı güncelle
+                    _cfg(image=photo, text="")
+                    video_label.image = photo  # Referansı sakla
+        
         except Exception as e:
             logging.error(f"Video frame güncelleme hatası: {str(e)}")
     
@@ -763,9 +807,6 @@ class MainWindow:
                 ttk.Label(stat_frame, text=f"{label}:", font=('Arial', 9, 'bold')).pack(anchor='w')
                 ttk.Label(stat_frame, text=str(value), font=('Arial', 9)).pack(anchor='w')
             
-            # Bir sonraki güncelleme için zamanlayıcı
-            self.stats_update_job = self.root.after(5000, self._update_stats)  # 5 saniyede bir
-            
         except Exception as e:
             logging.error(f"Stats güncelleme hatası: {str(e)}")
     
@@ -793,41 +834,72 @@ class MainWindow:
     
     def _cleanup_and_close(self):
         """Kaynakları temizler ve pencereyi kapatır"""
+        self.__exit__(None, None, None)
+        
+        if not self.owns_root:
+            self._hand_close_to_owner()
+    
+    def _hand_close_to_owner(self):
+        """Paylaşılan root'un kapatılmasını sahibinin kapatma komutuna bırakır"""
+        owner_cmd = self._owner_close_cmd
+        try:
+            self.root.protocol("WM_DELETE_WINDOW", owner_cmd)
+            if owner_cmd:
+                self.root.tk.call(owner_cmd)
+            else:
+                # Sahip komut tanımlamamışsa Tk'nın varsayılan davranışı
+                self.root.destroy()
+        except tk.TclError:
+            pass
+    
+    def _on_root_destroy(self, event):
+        """Paylaşılan root yok edilirken servisleri durdurur"""
+        if event.widget is self.root:
+            self.__exit__(None, None, None)
+    
+    def __enter__(self):
+        """Context manager girişi - pencere yaşam döngüsü with bloğuna bağlanır"""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, tb):
+        """Context manager çıkışı - hata olsa bile tüm kaynakları temizler"""
+        if self._closed:
+            return False
+        self._closed = True
+        
         try:
             logging.info("Ana pencere kapatılıyor, kaynaklar temizleniyor...")
             
-            # Update job'ları iptal et
-            if self.video_update_job:
-                self.root.after_cancel(self.video_update_job)
-            if self.stats_update_job:
-                self.root.after_cancel(self.stats_update_job)
+            # Periyodik güncellemeyi iptal et
+            if self._tick_job:
+                self.root.after_cancel(self._tick_job)
+                self._tick_job = None
             
-            # Servisleri durdur
-            if self.is_detection_active.get():
-                self.camera_service.stop_detection()
-            
-            if self.is_camera_running.get():
-                self.camera_service.stop_capture()
-            
-            if self.is_streaming_active.get():
-                self.streaming_service.stop_streaming()
-            
-            # Pencereyi kapat
-            self.root.quit()
+            # Servisleri durdur (streaming -> kamera); ExitStack biri hata verse de hepsini çalıştırır
+            self._stack.close()
             
-        except Exception as e:
-            logging.error(f"Cleanup sırasında hata: {str(e)}")
-            self.root.quit()
+        except Exception:
+            logging.exception("Cleanup sırasında hata")
+        finally:
+            # Pencereyi yalnızca root bu sınıfa aitse kapat; paylaşılan root sahibine bırakılır
+            if self.owns_root:
+                try:
+                    self.root.quit()
+                    self.root.destroy()
+                except tk.TclError:
+                    pass
+        
+        return False
     
-    def run(self):
-        """Pencereyi çalıştırır"""
+    def mainloop_run(self):
+        """Pencereyi oluşturur ve ana döngüyü çalıştırır"""
         try:
             self.create_window()
             
             logging.info(f"Ana pencere başlatılıyor - Kullanıcı: {self.user_data['email']}")
             
-            # İstatistik güncellemesini başlat
-            self._update_stats()
+            # Video ve istatistik güncellemesini başlat
+            self._start_tick()
             
             if self.owns_root:
                 self.root.mainloop()
@@ -835,12 +907,16 @@ class MainWindow:
         except Exception as e:
             logging.error(f"Ana pencere çalışırken hata: {str(e)}")
             raise e
-        finally:
-            if self.owns_root:
-                try:
-                    self.root.destroy()
-                except:
-                    pass
+    
+    def run(self):
+        """Pencereyi çalıştırır"""
+        if not self.owns_root:
+            # Paylaşılan root: mainloop sahibinde çalışır, temizlik kapatma/destroy olayına bağlıdır
+            self.mainloop_run()
+            return
+        
+        with self:
+            self.mainloop_run()
 
 # Test fonksiyonu
 def test_main_window():
@@ -855,8 +931,8 @@ def test_main_window():
             'name': 'Test Kullanıcı'
         }
         
-        main_window = MainWindow(test_user)
-        main_window.run()
+        with MainWindow(test_user) as main_window:
+            main_window.mainloop_run()
         
     except Exception as e:
         logging.error(f"Test sırasında hata: {str(e)}")
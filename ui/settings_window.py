@@ -15,15 +15,79 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
+import sys
+import threading
+from types import MappingProxyType
 from typing import Dict, Callable, Optional
 
 from services.database_service import get_database_service
 from services.notification_service import get_notification_service
+from services.storage_service import get_storage_service
 from config.settings import Settings
 
+# Tüm ayarların varsayılan değerleri - import sırasında bir kez hesaplanır.
+# Salt okunur: _load_current_settings kopyalamadan doğrudan döndürür.
+_DEFAULTS = MappingProxyType({
+    **Settings.DEFAULT_NOTIFICATION_SETTINGS_RO,
+    'phone_number': '',
+    'telegram_chat_id': '',
+    'camera_index': Settings.CAMERA_INDEX,
+    'camera_width': Settings.CAMERA_WIDTH,
+    'camera_height': Settings.CAMERA_HEIGHT,
+    'confidence_threshold': Settings.CONFIDENCE_THRESHOLD,
+    'auto_start_detection': False,
+    'auto_start_streaming': False,
+    'debug_mode': False,
+    'auto_delete_days': 30,
+})
+
+def _fmt_stats(stats: Dict) -> str:
+    """Kullanıcı istatistiklerini profil sekmesi için biçimlendirir"""
+    return (
+        f"Toplam Düşme Olayı: {stats.get('total_events', 0)}\n"
+        f"Bugünkü Olaylar: {stats.get('events_today', 0)}\n"
+        f"Bu Haftaki Olaylar: {stats.get('events_this_week', 0)}\n"
+        f"Bu Ayki Olaylar: {stats.get('events_this_month', 0)}"
+    )
+
 class SettingsWindow:
     """Ayarlar penceresi sınıfı"""
     
+    # Sabit pencere boyutu (genişlik, yükseklik)
+    WINDOW_SIZE = (500, 700)
+    
+    # Bildirim (toast) ayarları
+    TOAST_MS = 2000
+    _TOAST_COLORS = {'info': '#2e7d32', 'warning': '#ef6c00'}
+    
+    # Ayar değişkenleri: (anahtar, Tk değişken sınıfı) - varsayılanlar _DEFAULTS'tan gelir
+    _SPEC = (
+        ('email_notification', tk.BooleanVar),
+        ('sms_notification', tk.BooleanVar),
+        ('phone_number', tk.StringVar),
+        ('telegram_notification', tk.BooleanVar),
+        ('telegram_chat_id', tk.StringVar),
+        ('desktop_notification', tk.BooleanVar),
+        ('sound_notification', tk.BooleanVar),
+        ('camera_index', tk.IntVar),
+        ('camera_width', tk.IntVar),
+        ('camera_height', tk.IntVar),
+        ('confidence_threshold', tk.DoubleVar),
+        ('auto_start_detection', tk.BooleanVar),
+        ('auto_start_streaming', tk.BooleanVar),
+        ('debug_mode', tk.BooleanVar),
+        ('auto_delete_days', tk.IntVar),
+    )
+    
+    # Kaydetme sırasında türüne göre toplanan anahtarlar
+    _BOOL_KEYS = (
+        'email_notification', 'sms_notification', 'telegram_notification',
+        'desktop_notification', 'sound_notification',
+        'auto_start_detection', 'auto_start_streaming', 'debug_mode',
+    )
+    _STR_KEYS = ('phone_number', 'telegram_chat_id')
+    _INT_KEYS = ('camera_index', 'camera_width', 'camera_height')
+    
     def __init__(self, parent, user_data: Dict, callback: Callable = None):
         """Ayarlar penceresini başlatır"""
         self.parent = parent
@@ -41,13 +105,115 @@ class SettingsWindow:
         # Ayar değişkenleri
         self.settings_vars = {}
         
-        # Mevcut ayarları yükle
-        self.current_settings = self._load_current_settings()
+        # Mevcut ayarlar - pencere varsayılanlarla açılır, kayıtlı ayarlar arka planda yüklenir
+        self.current_settings = _DEFAULTS
+        self._pending_settings = None
+        self._pending_stats = None
+        
+        # Kayıtlı ayarlar gelmeden kullanıcının değiştirdiği alanlar (yükleme bunları ezmez)
+        self._edited_keys = set()
+        self._applying_settings = False
+        
+        # Yükleme bitene kadar devre dışı kalan butonlar
+        self._save_button = None
+        self._reset_button = None
+        
+        # Eşik etiketi debounce durumu
+        self._threshold_label = None
+        self._pending_thr = None
+        self._thr_job = None
+    
+    def __enter__(self):
+        """Modal pencereyi oluşturur - grab her durumda __exit__ ile bırakılır"""
+        self.window = tk.Toplevel(self.parent)
+        
+        # Modal pencere yap
+        self.window.transient(self.parent)
+        self.window.grab_set()
+        
+        try:
+            self.create_window()
+        except Exception:
+            # Widget oluşturma hatasında grab'i bırak ve pencereyi yok et
+            self.__exit__(*sys.exc_info())
+            raise
+        
+        # Kayıtlı ayarları UI thread'ini bloklamadan yükle
+        threading.Thread(target=self._bg_load, daemon=True).start()
+        
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            logging.info(f"SettingsWindow açıldı - Kullanıcı: {self.user_data['email']}")
+        return self
+    
+    def __exit__(self, exc_type, exc_val, tb):
+        """Grab'i bırakır ve pencereyi yok eder"""
+        if self.window is None:
+            return False
+        
+        window, self.window = self.window, None
+        try:
+            if self._thr_job:
+                window.after_cancel(self._thr_job)
+                self._thr_job = None
+            window.grab_release()
+        except tk.TclError:
+            pass
+        finally:
+            try:
+                window.destroy()
+            except tk.TclError:
+                pass
+        
+        return False
+    
+    def _bg_load(self):
+        """Ayarları arka plan thread'inde yükler ve sonucu ana thread'e iletir"""
+        self._pending_settings = self._load_current_settings()
         
-        # Pencereyi oluştur ve göster
-        self.create_window()
+        window = self.window
+        if window is None:
+            return
+        try:
+            window.after(0, self._apply_loaded_settings)
+        except (tk.TclError, RuntimeError):
+            # Pencere yükleme sırasında kapatıldı
+            pass
+    
+    def _apply_loaded_settings(self):
+        """Yüklenen ayarları ana thread'de Tk değişkenlerine uygular"""
+        if self.window is None or self._pending_settings is None:
+            return
+        
+        self.current_settings = self._pending_settings
+        self._set_vars_from(self.current_settings, skip=self._edited_keys)
+        
+        # Kayıtlı ayarlar yerleşti; artık kaydetme/sıfırlama varsayılanları yazmaz
+        for button in (self._save_button, self._reset_button):
+            if button is not None:
+                button.state(['!disabled'])
+    
+    def _set_vars_from(self, settings: Dict, skip=()):
+        """Verilen ayarları mevcut Tk değişkenlerine yazar"""
+        settings_get = settings.get
+        settings_vars = self.settings_vars
         
-        logging.info(f"SettingsWindow açıldı - Kullanıcı: {user_data['email']}")
+        self._applying_settings = True
+        try:
+            for name, _var_class in self._SPEC:
+                if name in skip:
+                    continue
+                value = settings_get(name, _DEFAULTS[name])
+                if name == 'confidence_threshold':
+                    value *= 100
+                    self._on_threshold_change(value)
+                settings_vars[name].set(value)
+        finally:
+            self._applying_settings = False
+    
+    def _on_var_write(self, name: str):
+        """Kullanıcının değiştirdiği alanı işaretler"""
+        if not self._applying_settings:
+            self._edited_keys.add(name)
     
     def _load_current_settings(self) -> Dict:
         """Mevcut ayarları yükler"""
@@ -56,23 +222,17 @@ class SettingsWindow:
             if user_data and 'settings' in user_data:
                 return user_data['settings']
             else:
-                return Settings.DEFAULT_NOTIFICATION_SETTINGS.copy()
+                return _DEFAULTS
                 
         except Exception as e:
             logging.error(f"Ayarlar yüklenirken hata: {str(e)}")
-            return Settings.DEFAULT_NOTIFICATION_SETTINGS.copy()
+            return _DEFAULTS
     
     def create_window(self):
         """Ayarlar penceresini oluşturur"""
-        self.window = tk.Toplevel(self.parent)
         self.window.title("Guard - Ayarlar")
-        self.window.geometry("500x700")
         self.window.resizable(False, False)
         
-        # Modal pencere yap
-        self.window.transient(self.parent)
-        self.window.grab_set()
-        
         # Pencereyi ortala
         self._center_window()
         
@@ -84,23 +244,37 @@ class SettingsWindow:
     
     def _center_window(self):
         """Pencereyi üst pencereye göre ortalar"""
-        self.window.update_idletasks()
-        
         parent_x = self.parent.winfo_x()
         parent_y = self.parent.winfo_y()
         parent_width = self.parent.winfo_width()
         parent_height = self.parent.winfo_height()
         
-        window_width = self.window.winfo_reqwidth()
-        window_height = self.window.winfo_reqheight()
+        # Pencere boyutu sabit (resizable=False), istenen boyutu ölçmeye gerek yok
+        window_width, window_height = self.WINDOW_SIZE
         
         x = parent_x + (parent_width - window_width) // 2
         y = parent_y + (parent_height - window_height) // 2
         
         self.window.geometry(f"{window_width}x{window_height}+{x}+{y}")
     
+    def _create_settings_vars(self):
+        """Tüm ayar değişkenlerini _SPEC üzerinden tek geçişte oluşturur"""
+        current_get = self.current_settings.get
+        settings_vars = self.settings_vars
+        
+        for name, var_class in self._SPEC:
+            value = current_get(name, _DEFAULTS[name])
+            if name == 'confidence_threshold':
+                value *= 100  # Scale yüzde olarak çalışır
+            var = var_class(value=value)
+            var.trace_add('write', lambda *_args, name=name: self._on_var_write(name))
+            settings_vars[name] = var
+    
     def _create_widgets(self):
         """UI bileşenlerini oluşturur"""
+        # Ayar değişkenleri
+        self._create_settings_vars()
+        
         # Ana frame
         main_frame = ttk.Frame(self.window, padding="20")
         main_frame.pack(fill=tk.BOTH, expand=True)
@@ -117,27 +291,43 @@ class SettingsWindow:
         notebook = ttk.Notebook(main_frame)
         notebook.pack(fill=tk.BOTH, expand=True, pady=(0, 20))
         
-        # Tab'ları oluştur
-        self._create_notification_tab(notebook)
-        self._create_camera_tab(notebook)
-        self._create_profile_tab(notebook)
-        self._create_advanced_tab(notebook)
+        # Tab'lar - içerikleri ilk seçildiklerinde oluşturulur
+        self._notebook = notebook
+        self._tab_builders = {}
+        self._built = set()
+        
+        for title, builder in (
+            ("Bildirimler", self._create_notification_tab_contents),
+            ("Kamera", self._create_camera_tab_contents),
+            ("Profil", self._create_profile_tab_contents),
+            ("Gelişmiş", self._create_advanced_tab_contents),
+        ):
+            tab_frame = ttk.Frame(notebook, padding="20")
+            notebook.add(tab_frame, text=title)
+            self._tab_builders[len(self._tab_builders)] = (tab_frame, builder)
+        
+        notebook.bind('<<NotebookTabChanged>>', self._on_tab)
+        self._on_tab()  # İlk (seçili) tab'ı hemen oluştur
         
         # Alt butonlar
         self._create_buttons(main_frame)
     
-    def _create_notification_tab(self, notebook):
+    def _on_tab(self, event=None):
+        """Seçilen tab'ın içeriğini ilk ziyarette oluşturur"""
+        idx = self._notebook.index('current')
+        if idx in self._built:
+            return
+        
+        self._built.add(idx)
+        tab_frame, builder = self._tab_builders[idx]
+        builder(tab_frame)
+    
+    def _create_notification_tab_contents(self, tab_frame):
         """Bildirim ayarları tab'ı"""
-        tab_frame = ttk.Frame(notebook, padding="20")
-        notebook.add(tab_frame, text="Bildirimler")
-        
         # E-posta bildirimleri
         email_frame = ttk.LabelFrame(tab_frame, text="E-posta Bildirimleri", padding="10")
         email_frame.pack(fill=tk.X, pady=(0, 10))
         
-        self.settings_vars['email_notification'] = tk.BooleanVar(
-            value=self.current_settings.get('email_notification', True)
-        )
         ttk.Checkbutton(
             email_frame,
             text="E-posta bildirimleri gönder",
@@ -148,9 +338,6 @@ class SettingsWindow:
         sms_frame = ttk.LabelFrame(tab_frame, text="SMS Bildirimleri", padding="10")
         sms_frame.pack(fill=tk.X, pady=(0, 10))
         
-        self.settings_vars['sms_notification'] = tk.BooleanVar(
-            value=self.current_settings.get('sms_notification', False)
-        )
         sms_check = ttk.Checkbutton(
             sms_frame,
             text="SMS bildirimleri gönder",
@@ -160,9 +347,6 @@ class SettingsWindow:
         
         # Telefon numarası
         ttk.Label(sms_frame, text="Telefon Numarası:").pack(anchor=tk.W, pady=(10, 0))
-        self.settings_vars['phone_number'] = tk.StringVar(
-            value=self.current_settings.get('phone_number', '')
-        )
         phone_entry = ttk.Entry(
             sms_frame,
             textvariable=self.settings_vars['phone_number'],
@@ -174,9 +358,6 @@ class SettingsWindow:
         telegram_frame = ttk.LabelFrame(tab_frame, text="Telegram Bildirimleri", padding="10")
         telegram_frame.pack(fill=tk.X, pady=(0, 10))
         
-        self.settings_vars['telegram_notification'] = tk.BooleanVar(
-            value=self.current_settings.get('telegram_notification', False)
-        )
         telegram_check = ttk.Checkbutton(
             telegram_frame,
             text="Telegram bildirimleri gönder",
@@ -186,9 +367,6 @@ class SettingsWindow:
         
         # Telegram Chat ID
         ttk.Label(telegram_frame, text="Telegram Chat ID:").pack(anchor=tk.W, pady=(10, 0))
-        self.settings_vars['telegram_chat_id'] = tk.StringVar(
-            value=self.current_settings.get('telegram_chat_id', '')
-        )
         telegram_entry = ttk.Entry(
             telegram_frame,
             textvariable=self.settings_vars['telegram_chat_id'],
@@ -200,9 +378,6 @@ class SettingsWindow:
         desktop_frame = ttk.LabelFrame(tab_frame, text="Desktop Bildirimleri", padding="10")
         desktop_frame.pack(fill=tk.X, pady=(0, 10))
         
-        self.settings_vars['desktop_notification'] = tk.BooleanVar(
-            value=self.current_settings.get('desktop_notification', True)
-        )
         ttk.Checkbutton(
             desktop_frame,
             text="Masaüstü bildirimleri göster",
@@ -210,66 +385,46 @@ class SettingsWindow:
         ).pack(anchor=tk.W)
         
         # Ses bildirimleri
-        self.settings_vars['sound_notification'] = tk.BooleanVar(
-            value=self.current_settings.get('sound_notification', True)
-        )
         ttk.Checkbutton(
             desktop_frame,
             text="Ses uyarıları çal",
             variable=self.settings_vars['sound_notification']
         ).pack(anchor=tk.W)
     
-    def _create_camera_tab(self, notebook):
+    def _create_camera_tab_contents(self, tab_frame):
         """Kamera ayarları tab'ı"""
-        tab_frame = ttk.Frame(notebook, padding="20")
-        notebook.add(tab_frame, text="Kamera")
-        
         # Kamera seçimi
         camera_frame = ttk.LabelFrame(tab_frame, text="Kamera Ayarları", padding="10")
         camera_frame.pack(fill=tk.X, pady=(0, 10))
         
-        ttk.Label(camera_frame, text="Kamera İndeksi:").pack(anchor=tk.W)
-        self.settings_vars['camera_index'] = tk.StringVar(
-            value=str(self.current_settings.get('camera_index', Settings.CAMERA_INDEX))
-        )
+        # Tek frame içinde grid yerleşimi - ara frame'ler olmadan
+        ttk.Label(camera_frame, text="Kamera İndeksi:").grid(row=0, column=0, columnspan=4, sticky='w')
         camera_entry = ttk.Entry(
             camera_frame,
             textvariable=self.settings_vars['camera_index'],
             width=10
         )
-        camera_entry.pack(anchor=tk.W, pady=(5, 10))
+        camera_entry.grid(row=1, column=0, columnspan=4, sticky='w', pady=(5, 10))
         
         # Çözünürlük ayarları
-        resolution_frame = ttk.Frame(camera_frame)
-        resolution_frame.pack(fill=tk.X, pady=(0, 10))
-        
-        ttk.Label(resolution_frame, text="Çözünürlük:").pack(anchor=tk.W)
+        ttk.Label(camera_frame, text="Çözünürlük:").grid(row=2, column=0, columnspan=4, sticky='w')
         
-        res_controls = ttk.Frame(resolution_frame)
-        res_controls.pack(anchor=tk.W, pady=(5, 0))
+        ttk.Label(camera_frame, text="Genişlik:").grid(row=3, column=0, sticky='w', pady=(5, 10))
+        width_entry = ttk.Entry(camera_frame, textvariable=self.settings_vars['camera_width'], width=8)
+        width_entry.grid(row=3, column=1, sticky='w', padx=(5, 10), pady=(5, 10))
         
-        ttk.Label(res_controls, text="Genişlik:").pack(side=tk.LEFT)
-        self.settings_vars['camera_width'] = tk.StringVar(
-            value=str(self.current_settings.get('camera_width', Settings.CAMERA_WIDTH))
-        )
-        width_entry = ttk.Entry(res_controls, textvariable=self.settings_vars['camera_width'], width=8)
-        width_entry.pack(side=tk.LEFT, padx=(5, 10))
+        ttk.Label(camera_frame, text="Yükseklik:").grid(row=3, column=2, sticky='w', pady=(5, 10))
+        height_entry = ttk.Entry(camera_frame, textvariable=self.settings_vars['camera_height'], width=8)
+        height_entry.grid(row=3, column=3, sticky='w', padx=5, pady=(5, 10))
         
-        ttk.Label(res_controls, text="Yükseklik:").pack(side=tk.LEFT)
-        self.settings_vars['camera_height'] = tk.StringVar(
-            value=str(self.current_settings.get('camera_height', Settings.CAMERA_HEIGHT))
-        )
-        height_entry = ttk.Entry(res_controls, textvariable=self.settings_vars['camera_height'], width=8)
-        height_entry.pack(side=tk.LEFT, padx=5)
+        # Artan genişlik boş son sütuna gider, kontroller solda kalır
+        camera_frame.columnconfigure(4, weight=1)
         
         # Model ayarları
         model_frame = ttk.LabelFrame(tab_frame, text="Düşme Tespit Ayarları", padding="10")
         model_frame.pack(fill=tk.X, pady=(0, 10))
         
         ttk.Label(model_frame, text="Güven Eşiği (%):").pack(anchor=tk.W)
-        self.settings_vars['confidence_threshold'] = tk.DoubleVar(
-            value=self.current_settings.get('confidence_threshold', Settings.CONFIDENCE_THRESHOLD) * 100
-        )
         
         threshold_frame = ttk.Frame(model_frame)
         threshold_frame.pack(anchor=tk.W, pady=(5, 0))
@@ -284,21 +439,28 @@ class SettingsWindow:
         )
         threshold_scale.pack(side=tk.LEFT)
         
-        threshold_label = ttk.Label(threshold_frame, text="70%")
-        threshold_label.pack(side=tk.LEFT, padx=(10, 0))
+        self._threshold_label = ttk.Label(threshold_frame, text="70%")
+        self._threshold_label.pack(side=tk.LEFT, padx=(10, 0))
         
-        # Scale değer güncellemesi
-        def update_threshold_label(value):
-            threshold_label.config(text=f"{float(value):.0f}%")
-        
-        threshold_scale.configure(command=update_threshold_label)
-        update_threshold_label(self.settings_vars['confidence_threshold'].get())
+        # Scale değer güncellemesi (sürükleme sırasında ~30 Hz ile sınırlandırılır)
+        threshold_scale.configure(command=self._on_threshold_change)
+        self._pending_thr = self.settings_vars['confidence_threshold'].get()
+        self._flush_thr()
+    
+    def _on_threshold_change(self, value):
+        """Eşik etiketi güncellemesini birleştirir - her pikselde değil en fazla 33 ms'de bir"""
+        self._pending_thr = value
+        if not self._thr_job:
+            self._thr_job = self.window.after(33, self._flush_thr)
+    
+    def _flush_thr(self):
+        """Bekleyen eşik değerini etikete yazar"""
+        self._thr_job = None
+        if self._threshold_label is not None:  # Kamera tab'ı henüz oluşturulmamış olabilir
+            self._threshold_label.config(text=f"{float(self._pending_thr):.0f}%")
     
-    def _create_profile_tab(self, notebook):
+    def _create_profile_tab_contents(self, tab_frame):
         """Profil bilgileri tab'ı"""
-        tab_frame = ttk.Frame(notebook, padding="20")
-        notebook.add(tab_frame, text="Profil")
-        
         # Kullanıcı bilgileri
         profile_frame = ttk.LabelFrame(tab_frame, text="Kullanıcı Bilgileri", padding="10")
         profile_frame.pack(fill=tk.X, pady=(0, 10))
@@ -343,35 +505,47 @@ class SettingsWindow:
         stats_frame = ttk.LabelFrame(tab_frame, text="İstatistikler", padding="10")
         stats_frame.pack(fill=tk.X, pady=(0, 10))
         
+        self._stats_var = tk.StringVar(value="İstatistikler yükleniyor...")
+        ttk.Label(stats_frame, textvariable=self._stats_var, font=('Arial', 9)).pack(anchor=tk.W)
+        
+        # İstatistikleri arka planda getir
+        threading.Thread(target=self._bg_load_stats, daemon=True).start()
+    
+    def _bg_load_stats(self):
+        """İstatistikleri arka plan thread'inde getirir"""
         try:
-            stats = self.database_service.get_user_stats(self.user_id)
-            
-            stats_text = f"""
-Toplam Düşme Olayı: {stats.get('total_events', 0)}
-Bugünkü Olaylar: {stats.get('events_today', 0)}
-Bu Haftaki Olaylar: {stats.get('events_this_week', 0)}
-Bu Ayki Olaylar: {stats.get('events_this_month', 0)}
-            """.strip()
-            
-            stats_label = ttk.Label(stats_frame, text=stats_text, font=('Arial', 9))
-            stats_label.pack(anchor=tk.W)
-            
+            self._pending_stats = self.database_service.get_user_stats(self.user_id)
         except Exception as e:
-            ttk.Label(stats_frame, text="İstatistikler yüklenemedi").pack(anchor=tk.W)
+            logging.error(f"İstatistikler yüklenirken hata: {str(e)}")
+            self._pending_stats = None
+        
+        window = self.window
+        if window is None:
+            return
+        try:
+            window.after(0, self._on_stats_ready)
+        except (tk.TclError, RuntimeError):
+            # Pencere istatistikler yüklenirken kapatıldı
+            pass
+    
+    def _on_stats_ready(self):
+        """İstatistik etiketini ana thread'de günceller"""
+        if self.window is None:
+            return
+        
+        stats = self._pending_stats
+        if stats is None:
+            self._stats_var.set("İstatistikler yüklenemedi")
+        else:
+            self._stats_var.set(_fmt_stats(stats))
     
-    def _create_advanced_tab(self, notebook):
+    def _create_advanced_tab_contents(self, tab_frame):
         """Gelişmiş ayarlar tab'ı"""
-        tab_frame = ttk.Frame(notebook, padding="20")
-        notebook.add(tab_frame, text="Gelişmiş")
-        
         # Sistem ayarları
         system_frame = ttk.LabelFrame(tab_frame, text="Sistem Ayarları", padding="10")
         system_frame.pack(fill=tk.X, pady=(0, 10))
         
         # Otomatik başlatma
-        self.settings_vars['auto_start_detection'] = tk.BooleanVar(
-            value=self.current_settings.get('auto_start_detection', False)
-        )
         ttk.Checkbutton(
             system_frame,
             text="Uygulama açılışında tespiti otomatik başlat",
@@ -379,9 +553,6 @@ Bu Ayki Olaylar: {stats.get('events_this_month', 0)}
         ).pack(anchor=tk.W, pady=2)
         
         # Otomatik streaming
-        self.settings_vars['auto_start_streaming'] = tk.BooleanVar(
-            value=self.current_settings.get('auto_start_streaming', False)
-        )
         ttk.Checkbutton(
             system_frame,
             text="Uygulama açılışında streaming'i otomatik başlat",
@@ -389,9 +560,6 @@ Bu Ayki Olaylar: {stats.get('events_this_month', 0)}
         ).pack(anchor=tk.W, pady=2)
         
         # Debug modu
-        self.settings_vars['debug_mode'] = tk.BooleanVar(
-            value=self.current_settings.get('debug_mode', False)
-        )
         ttk.Checkbutton(
             system_frame,
             text="Debug modu (geliştiriciler için)",
@@ -404,9 +572,6 @@ Bu Ayki Olaylar: {stats.get('events_this_month', 0)}
         
         # Eski olayları temizle
         ttk.Label(storage_frame, text="Eski olayları otomatik sil (gün):").pack(anchor=tk.W)
-        self.settings_vars['auto_delete_days'] = tk.StringVar(
-            value=str(self.current_settings.get('auto_delete_days', 30))
-        )
         days_entry = ttk.Entry(
             storage_frame,
             textvariable=self.settings_vars['auto_delete_days'],
@@ -415,12 +580,15 @@ Bu Ayki Olaylar: {stats.get('events_this_month', 0)}
         days_entry.pack(anchor=tk.W, pady=(5, 10))
         
         # Temizlik butonu
-        cleanup_button = ttk.Button(
+        self._cleanup_button = ttk.Button(
             storage_frame,
             text="Eski Verileri Şimdi Temizle",
             command=self._cleanup_old_data
         )
-        cleanup_button.pack(anchor=tk.W)
+        self._cleanup_button.pack(anchor=tk.W)
+        
+        # Temizlik ilerleme göstergesi (yalnızca işlem sırasında görünür)
+        self._cleanup_progress = ttk.Progressbar(storage_frame, mode='indeterminate', length=200)
         
         # Test butonu
         test_frame = ttk.LabelFrame(tab_frame, text="Test İşlemleri", padding="10")
@@ -446,70 +614,66 @@ Bu Ayki Olaylar: {stats.get('events_this_month', 0)}
         )
         cancel_button.pack(side=tk.RIGHT, padx=(10, 0))
         
-        # Kaydet butonu
-        save_button = ttk.Button(
+        # Kaydet butonu - kayıtlı ayarlar yüklenene kadar devre dışı
+        self._save_button = ttk.Button(
             button_frame,
             text="Kaydet",
-            command=self._save_settings
+            command=self._save_settings,
+            state=tk.DISABLED
         )
-        save_button.pack(side=tk.RIGHT)
+        self._save_button.pack(side=tk.RIGHT)
         
-        # Varsayılana sıfırla butonu
-        reset_button = ttk.Button(
+        # Varsayılana sıfırla butonu - kayıtlı ayarlar yüklenene kadar devre dışı
+        self._reset_button = ttk.Button(
             button_frame,
             text="Varsayılana Sıfırla",
-            command=self._reset_to_defaults
+            command=self._reset_to_defaults,
+            state=tk.DISABLED
         )
-        reset_button.pack(side=tk.LEFT)
+        self._reset_button.pack(side=tk.LEFT)
     
     def _save_settings(self):
         """Ayarları kaydeder"""
         try:
-            # Form verilerini topla
-            new_settings = {}
+            sv = self.settings_vars
             
-            # Bildirim ayarları
-            new_settings['email_notification'] = self.settings_vars['email_notification'].get()
-            new_settings['sms_notification'] = self.settings_vars['sms_notification'].get()
-            new_settings['telegram_notification'] = self.settings_vars['telegram_notification'].get()
-            new_settings['desktop_notification'] = self.settings_vars['desktop_notification'].get()
-            new_settings['sound_notification'] = self.settings_vars['sound_notification'].get()
+            # Form verilerini topla - bildirim ve gelişmiş ayarlar
+            new_settings = {key: sv[key].get() for key in self._BOOL_KEYS}
             
-            new_settings['phone_number'] = self.settings_vars['phone_number'].get().strip()
-            new_settings['telegram_chat_id'] = self.settings_vars['telegram_chat_id'].get().strip()
+            for key in self._STR_KEYS:
+                new_settings[key] = sv[key].get().strip()
             
-            # Kamera ayarları
+            # Kamera ayarları - IntVar/DoubleVar değeri Tk tarafında sayıya çevrilir
             try:
-                new_settings['camera_index'] = int(self.settings_vars['camera_index'].get())
-                new_settings['camera_width'] = int(self.settings_vars['camera_width'].get())
-                new_settings['camera_height'] = int(self.settings_vars['camera_height'].get())
-                new_settings['confidence_threshold'] = self.settings_vars['confidence_threshold'].get() / 100.0
-            except ValueError as e:
+                for key in self._INT_KEYS:
+                    new_settings[key] = sv[key].get()
+                new_settings['confidence_threshold'] = sv['confidence_threshold'].get() / 100.0
+            except tk.TclError as e:
                 messagebox.showerror("Hata", f"Geçersiz sayısal değer: {str(e)}")
                 return
             
-            # Gelişmiş ayarlar
-            new_settings['auto_start_detection'] = self.settings_vars['auto_start_detection'].get()
-            new_settings['auto_start_streaming'] = self.settings_vars['auto_start_streaming'].get()
-            new_settings['debug_mode'] = self.settings_vars['debug_mode'].get()
-            
             try:
-                new_settings['auto_delete_days'] = int(self.settings_vars['auto_delete_days'].get())
-            except ValueError:
+                new_settings['auto_delete_days'] = sv['auto_delete_days'].get()
+            except tk.TclError:
                 new_settings['auto_delete_days'] = 30
             
             # Ayarları kaydet
             success = self.database_service.save_user_settings(self.user_id, new_settings)
             
             if success:
-                messagebox.showinfo("Başarılı", "Ayarlar kaydedildi!")
+                # Debug modunu log seviyesine bir kez uygula; filtrelenen kayıtlar hiç biçimlendirilmez
+                logging.getLogger().setLevel(
+                    logging.DEBUG if new_settings['debug_mode'] else getattr(logging, Settings.LOG_LEVEL)
+                )
+                
+                self._toast("Ayarlar kaydedildi!")
                 
                 # Callback'i çağır
                 if self.callback:
                     self.callback()
                 
                 # Pencereyi kapat
-                self.window.destroy()
+                self.__exit__(None, None, None)
             else:
                 messagebox.showerror("Hata", "Ayarlar kaydedilemedi!")
                 
@@ -526,32 +690,10 @@ Bu Ayki Olaylar: {stats.get('events_this_month', 0)}
         
         if response:
             try:
-                # Varsayılan değerleri ayarla
-                defaults = Settings.DEFAULT_NOTIFICATION_SETTINGS.copy()
-                defaults.update({
-                    'camera_index': Settings.CAMERA_INDEX,
-                    'camera_width': Settings.CAMERA_WIDTH,
-                    'camera_height': Settings.CAMERA_HEIGHT,
-                    'confidence_threshold': Settings.CONFIDENCE_THRESHOLD,
-                    'auto_start_detection': False,
-                    'auto_start_streaming': False,
-                    'debug_mode': False,
-                    'auto_delete_days': 30,
-                    'phone_number': '',
-                    'telegram_chat_id': ''
-                })
-                
-                # UI'yi güncelle
-                for key, value in defaults.items():
-                    if key in self.settings_vars:
-                        if isinstance(value, bool):
-                            self.settings_vars[key].set(value)
-                        elif key == 'confidence_threshold':
-                            self.settings_vars[key].set(value * 100)
-                        else:
-                            self.settings_vars[key].set(str(value))
+                # UI'yi varsayılan değerlerle güncelle
+                self._set_vars_from(_DEFAULTS)
                 
-                messagebox.showinfo("Başarılı", "Ayarlar varsayılan değerlere sıfırlandı!")
+                self._toast("Ayarlar varsayılan değerlere sıfırlandı!")
                 
             except Exception as e:
                 logging.error(f"Varsayılana sıfırlama hatası: {str(e)}")
@@ -563,7 +705,7 @@ Bu Ayki Olaylar: {stats.get('events_this_month', 0)}
             success = self.notification_service.send_test_notification(self.user_id)
             
             if success:
-                messagebox.showinfo("Test Bildirimi", "Test bildirimi gönderildi!")
+                self._toast("Test bildirimi gönderildi!")
             else:
                 messagebox.showerror("Hata", "Test bildirimi gönderilemedi!")
                 
@@ -578,34 +720,95 @@ Bu Ayki Olaylar: {stats.get('events_this_month', 0)}
             "Eski veriler silinecek. Bu işlem geri alınamaz.\n\nDevam etmek istiyor musunuz?"
         )
         
-        if response:
+        if not response:
+            return
+        
+        # İşlem sürerken butonu kilitle ve ilerleme göstergesini göster
+        self._cleanup_button.config(state='disabled')
+        self._cleanup_progress.pack(anchor=tk.W, pady=(10, 0))
+        self._cleanup_progress.start(10)
+        
+        def _worker():
+            # Ağ/disk işlemleri UI thread'ini bloklamaz; Tk çağrıları after(0) ile ana thread'e taşınır
             try:
                 # Eski olayları temizle
                 deleted_events = self.database_service.cleanup_old_events(self.user_id)
                 
                 # Eski ekran görüntülerini temizle
-                from services.storage_service import get_storage_service
                 storage_service = get_storage_service()
                 deleted_screenshots = storage_service.cleanup_old_screenshots(self.user_id)
                 
-                messagebox.showinfo(
-                    "Temizlik Tamamlandı",
-                    f"Temizlik tamamlandı!\n\n"
-                    f"Silinen olay sayısı: {deleted_events}\n"
-                    f"Silinen görüntü sayısı: {deleted_screenshots}"
-                )
-                
+                result = (deleted_events, deleted_screenshots, None)
             except Exception as e:
                 logging.error(f"Veri temizliği hatası: {str(e)}")
-                messagebox.showerror("Hata", f"Veri temizliği sırasında hata:\n{str(e)}")
+                result = (0, 0, e)
+            
+            window = self.window
+            if window is not None:
+                try:
+                    window.after(0, self._on_cleanup_done, *result)
+                    return
+                except (tk.TclError, RuntimeError):
+                    pass
+            
+            # Pencere temizlik sırasında kapatıldı; sonuç kaybolmasın diye loglanır
+            deleted_events, deleted_screenshots, error = result
+            if error is None:
+                logging.info(f"Veri temizliği tamamlandı - {deleted_events} olay, "
+                             f"{deleted_screenshots} ekran görüntüsü silindi")
+        
+        threading.Thread(target=_worker, daemon=True).start()
+    
+    def _on_cleanup_done(self, deleted_events, deleted_screenshots, error):
+        """Temizlik tamamlandığında ana thread'de sonucu gösterir"""
+        if self.window is None:
+            return
+        
+        self._cleanup_progress.stop()
+        self._cleanup_progress.pack_forget()
+        self._cleanup_button.config(state='normal')
+        
+        if error is not None:
+            messagebox.showerror("Hata", f"Veri temizliği sırasında hata:\n{str(error)}")
+            return
+        
+        self._toast(
+            f"Temizlik tamamlandı!\n\n"
+            f"Silinen olay sayısı: {deleted_events}\n"
+            f"Silinen görüntü sayısı: {deleted_screenshots}"
+        )
+    
+    def _toast(self, text: str, kind: str = 'info'):
+        """Ana döngüyü bloklamayan, kendiliğinden kapanan kısa bildirim gösterir"""
+        # Ayarlar penceresi kapanmış olabileceği için üst pencereye bağlanır
+        toast = tk.Toplevel(self.parent)
+        toast.overrideredirect(True)
+        toast.attributes('-topmost', True)
+        
+        tk.Label(
+            toast,
+            text=text,
+            bg=self._TOAST_COLORS.get(kind, self._TOAST_COLORS['info']),
+            fg='white',
+            font=('Arial', 10),
+            justify=tk.LEFT,
+            padx=16,
+            pady=10
+        ).pack()
+        
+        # Ana pencerenin sol üst köşesine yakın konumlandır
+        x = self.parent.winfo_rootx() + 20
+        y = self.parent.winfo_rooty() + 20
+        toast.geometry(f"+{x}+{y}")
+        
+        toast.after(self.TOAST_MS, toast.destroy)
     
     def _on_cancel(self):
         """İptal butonuna basıldığında"""
-        self.window.destroy()
+        self.__exit__(None, None, None)
     
-    def _on_window_close(self):
-        """Pencere kapatma olayını işler"""
-        self.window.destroy()
+    # Pencere kapatma olayı iptal ile aynı şekilde işlenir
+    _on_window_close = _on_cancel
 
 # Test fonksiyonu
 def test_settings_window():
@@ -622,8 +825,8 @@ def test_settings_window():
             'name': 'Test Kullanıcı'
         }
         
-        settings_window = SettingsWindow(root, test_user)
-        root.mainloop()
+        with SettingsWindow(root, test_user) as settings_window:
+            root.wait_window(settings_window.window)
         
     except Exception as e:
         logging.error(f"Test sırasında hata: {str(e)}")
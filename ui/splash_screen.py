@@ -15,18 +15,63 @@
 # =======================================================================================
 
 import tkinter as tk
-import time
 import threading
 import os
 import logging
-from PIL import Image, ImageTk, ImageEnhance, ImageFilter
-import math
+from PIL import Image, ImageTk, ImageEnhance, ImageFilter, ImageDraw
 import random
+import hashlib
+import numpy as np
 from config.settings import Settings
 
+# İşlenmiş logo görüntülerinin önbellek dizini
+LOGO_CACHE_DIR = os.path.join("assets", ".cache")
+# Logo işleme adımları değiştiğinde eski önbelleği geçersiz kılmak için artırılır
+LOGO_CACHE_VERSION = 4
+
+# Parlaklık ve kontrast artışını tek geçişte uygulayan RGBA tablosu
+_tone = np.clip((np.arange(256, dtype=np.float32) * 1.3 - 128) * 1.2 + 128, 0, 255).astype(np.uint8).tolist()
+LOGO_TONE_LUT = _tone * 3 + list(range(256))
+
 class SplashScreen:
     """Ultra modern ve etkileyici uygulama açılış ekranı, giriş sayfasına yumuşak geçiş."""
     
+    PARTICLE_COUNT = 50
+    
+    # Guard temasına uygun gradient renkler
+    GRADIENT_COLORS = (
+        "#1A237E",  # Derin indigo (başlangıç)
+        "#303F9F",  # Koyu indigo (orta)
+        "#3949AB",  # İndigo (orta)
+        "#3F51B5",  # Orta indigo (bitiş)
+    )
+    # Renk durakları sınıf tanımında bir kez (4, 3) dizisine çevrilir
+    GRADIENT_STOPS = np.array(
+        [[int(c[1:3], 16), int(c[3:5], 16), int(c[5:7], 16)] for c in GRADIENT_COLORS],
+        dtype=np.float32
+    )
+    
+    # Alt başlık metin seçenekleri
+    SUBTITLES = (
+        "Akıllı Düşme Algılama Sistemi",
+        "Güvenliğiniz İçin Geliştirildi",
+        "7/24 Kesintisiz Koruma",
+        "Hızlı & Anlık Bildirimler",
+        "Yapay Zeka Destekli",
+        "Gerçek Zamanlı İzleme"
+    )
+    
+    # Yükleniyor mesaj listesi
+    LOADING_MESSAGES = (
+        "Başlatılıyor...",
+        "Modeller yükleniyor...",
+        "AI sistemi hazırlanıyor...",
+        "Kamera modülü başlatılıyor...",
+        "Ağ bağlantıları kuruluyor...",
+        "Bildirim sistemi yapılandırılıyor...",
+        "Son kontroller yapılıyor..."
+    )
+    
     def __init__(self, root, duration=4.0, callback=None):
         """
         Args:
@@ -38,7 +83,28 @@ class SplashScreen:
         self.duration = duration
         self.callback = callback
         self.splash_window = None
-        self.particles = []  # Parçacık animasyonu için
+        
+        # Canvas'a çizilen görüntülerin referansları (etiket -> PhotoImage)
+        self._photos = {}
+        
+        # Parçacık ve ışıltı efektleri için tek rastgele sayı üreteci
+        self._rng = np.random.default_rng()
+        
+        # Animasyonlar yalnızca pencere açıkken çalışır
+        self._alive = False
+        
+        # Logo nabız animasyonu durumu
+        self.glow_label = None
+        self.pulse_scale = 1.0
+        self.pulse_direction = -1
+        self.pulse_min = 0.95
+        self.pulse_max = 1.05
+        self.pulse_step = 0.005
+        
+        # Metin animasyonu durumu
+        self._ui_tick = 0
+        self.subtitle_index = 0
+        self.message_index = 0
         
         logging.info(f"SplashScreen başlatılıyor - süre: {duration}s")
         
@@ -54,51 +120,70 @@ class SplashScreen:
     def _show_splash(self):
         """Ultra modern ve etkileyici splash ekranını gösterir."""
         try:
-            # Yeni bir pencere oluştur
-            self.splash_window = tk.Toplevel(self.root)
-            self.splash_window.title("Guard")
-            
-            # Ekran ölçüleri
-            screen_width = self.splash_window.winfo_screenwidth()
-            screen_height = self.splash_window.winfo_screenheight()
-            
-            # Splash ekranı boyutu (ekranın %70'i)
-            width = int(screen_width * 0.7)
-            height = int(screen_height * 0.7)
-            
-            # Merkezi pozisyon
-            x = (screen_width - width) // 2
-            y = (screen_height - height) // 2
-            
-            # Pencere boyutunu ve konumunu ayarla
-            self.splash_window.geometry(f"{width}x{height}+{x}+{y}")
-            
-            # Pencere dekorasyonlarını kaldır ve borderless yap
-            self.splash_window.overrideredirect(True)
-            
-            # Pencereyi yarı saydam yap
-            self.splash_window.attributes("-alpha", 0.97)
-            
-            # Pencereyi en üstte tut
-            self.splash_window.attributes("-topmost", True)
-            
-            # Ana canvas 
-            self.canvas = tk.Canvas(self.splash_window, highlightthickness=0, bg="#121212")
-            self.canvas.pack(fill="both", expand=True)
+            # Önce ilk görüntü, dekorasyonlar olay döngüsü boşaldığında
+            self._show_splash_minimal()
+            self.root.after_idle(self._show_splash_decor)
             
-            # Guard temasına uygun gradient renkler
-            gradient_colors = [
-                "#1A237E",  # Derin indigo (başlangıç)
-                "#303F9F",  # Koyu indigo (orta)
-                "#3949AB",  # İndigo (orta)
-                "#3F51B5",  # Orta indigo (bitiş)
-            ]
-            
-            # Animasyonlu arkaplan için değişkenler
-            self.wave_offset = 0
+        except Exception as e:
+            logging.error(f"Splash screen oluşturulurken hata: {str(e)}")
+            # Hata durumunda direkt ana pencereyi göster
+            self._close_splash()
+
+    def _show_splash_minimal(self):
+        """Pencere, arka plan, logo ve marka yazısını hemen oluşturur."""
+        self._alive = True
+        
+        # Yeni bir pencere oluştur
+        self.splash_window = tk.Toplevel(self.root)
+        self.splash_window.title("Guard")
+        
+        # Ekran ölçüleri
+        screen_width = self.splash_window.winfo_screenwidth()
+        screen_height = self.splash_window.winfo_screenheight()
+        
+        # Splash ekranı boyutu (ekranın %70'i)
+        width = int(screen_width * 0.7)
+        height = int(screen_height * 0.7)
+        
+        # Merkezi pozisyon
+        x = (screen_width - width) // 2
+        y = (screen_height - height) // 2
+        
+        # Pencere boyutunu ve konumunu ayarla
+        self.splash_window.geometry(f"{width}x{height}+{x}+{y}")
+        
+        # Pencere dekorasyonlarını kaldır ve borderless yap
+        self.splash_window.overrideredirect(True)
+        
+        # Pencereyi yarı saydam yap
+        self.splash_window.attributes("-alpha", 0.97)
+        
+        # Pencereyi en üstte tut
+        self.splash_window.attributes("-topmost", True)
+        
+        # Ana canvas 
+        self.canvas = tk.Canvas(self.splash_window, highlightthickness=0, bg="#121212")
+        self.canvas.pack(fill="both", expand=True)
+        
+        # Ana gradient arka plan
+        self._create_gradient_background(width, height)
+        
+        # Logo ve marka bölümü
+        self._create_logo_section(width, height)
+        
+        # Markalama bölümü (daha etkileyici)
+        self._create_branding_section(width, height)
+        
+        # Ertelenen dekorasyonlar için boyut
+        self._splash_size = (width, height)
+
+    def _show_splash_decor(self):
+        """Parçacıklar, ilerleme göstergesi, footer ve animasyonları sonradan ekler."""
+        if not self._alive:
+            return
             
-            # Ana gradient arka plan
-            self._create_gradient_background(width, height, gradient_colors)
+        try:
+            width, height = self._splash_size
             
             # Efekt parçacıkları (yıldız benzeri)
             self._initialize_particles(width, height)
@@ -106,26 +191,14 @@ class SplashScreen:
             # Parçacık animasyonu
             self._animate_particles()
             
-            # Dekoratif ışık efektleri
-            self._create_light_effects(width, height)
-                                    
-            # Arka plan animasyonu
-            self._animate_background()
-                                    
-            # Logo ve marka bölümü
-            self._create_logo_section(width, height)
-            
-            # Markalama bölümü (daha etkileyici)
-            self._create_branding_section(width, height)
-            
             # Modern ilerleme göstergesi
             self._create_progress_section(width, height)
             
             # Versiyon ve telif bilgisi
             self._create_footer_section(width, height)
             
-            # Ekstra görsellik: Gelişmiş ışıma efekti
-            self._create_beam_effect(width, height)
+            # Alt başlık ve yükleniyor metni animasyonları
+            self._tick_ui()
             
             logging.info("Splash screen başarıyla oluşturuldu")
             
@@ -134,73 +207,89 @@ class SplashScreen:
             # Hata durumunda direkt ana pencereyi göster
             self._close_splash()
 
-    def _create_gradient_background(self, width, height, gradient_colors):
-        """Gradient arka plan oluşturur"""
-        for i in range(height):
-            # Yüzde olarak geçerli pozisyon
-            percent = i / height
-            
-            # Dalgalı gradient için pozisyonu modifiye et
-            wave_percent = percent + math.sin(i / 50) * 0.03
-            wave_percent = max(0, min(1, wave_percent))
-            
-            # Renk hesaplama
-            if wave_percent < 0.33:
-                t = wave_percent * 3  # 0 -> 1
-                r1, g1, b1 = int(gradient_colors[0][1:3], 16), int(gradient_colors[0][3:5], 16), int(gradient_colors[0][5:7], 16)
-                r2, g2, b2 = int(gradient_colors[1][1:3], 16), int(gradient_colors[1][3:5], 16), int(gradient_colors[1][5:7], 16)
-            elif wave_percent < 0.66:
-                t = (wave_percent - 0.33) * 3  # 0 -> 1
-                r1, g1, b1 = int(gradient_colors[1][1:3], 16), int(gradient_colors[1][3:5], 16), int(gradient_colors[1][5:7], 16)
-                r2, g2, b2 = int(gradient_colors[2][1:3], 16), int(gradient_colors[2][3:5], 16), int(gradient_colors[2][5:7], 16)
-            else:
-                t = (wave_percent - 0.66) * 3  # 0 -> 1
-                r1, g1, b1 = int(gradient_colors[2][1:3], 16), int(gradient_colors[2][3:5], 16), int(gradient_colors[2][5:7], 16)
-                r2, g2, b2 = int(gradient_colors[3][1:3], 16), int(gradient_colors[3][3:5], 16), int(gradient_colors[3][5:7], 16)
-            
-            # İki rengi karıştır
-            r = int(r1 * (1 - t) + r2 * t)
-            g = int(g1 * (1 - t) + g2 * t)
-            b = int(b1 * (1 - t) + b2 * t)
-            
-            # Ekstra ışıltı efekti
-            sparkle_effect = random.randint(0, 100) < 2  # %2 ihtimal
-            if sparkle_effect:
-                r = min(255, r + 30)
-                g = min(255, g + 30)
-                b = min(255, b + 30)
-            
-            color = f'#{r:02x}{g:02x}{b:02x}'
-            self.canvas.create_line(0, i, width, i, fill=color, smooth=True)
+    def _create_gradient_background(self, width, height):
+        """Gradient arka planı NumPy ile tek bir görüntü olarak oluşturur"""
+        stops = self.GRADIENT_STOPS
+        
+        # Dalgalı gradient için satır pozisyonları
+        ys = np.arange(height, dtype=np.float32)
+        wave_percent = np.clip(ys / height + 0.03 * np.sin(ys / 50), 0, 1)
+        
+        # Segment indeksi (0, 1, 2) ve segment içi oran
+        seg = np.searchsorted(np.array([0.33, 0.66], dtype=np.float32), wave_percent, side='right')
+        t = np.clip((wave_percent - seg * 0.33) * 3, 0, 1)[:, None]
+        
+        # İki rengi karıştır
+        rows = (1 - t) * stops[seg] + t * stops[seg + 1]
+        
+        # Ekstra ışıltı efekti (%2 ihtimal)
+        sparkle = self._rng.random(height) < 0.02
+        rows[sparkle] += 30
+        rows = np.clip(rows, 0, 255).astype(np.uint8)
+        
+        # Satırları tüm genişliğe yay
+        arr = np.ascontiguousarray(np.broadcast_to(rows[:, None, :], (height, width, 3)))
+        
+        # Işık efektlerini arka plana göm ve tek görüntü olarak çiz
+        base = Image.fromarray(arr, 'RGB').convert('RGBA')
+        base = Image.alpha_composite(base, self._create_light_overlay(width, height))
+        self._blit_rgb(self.canvas, np.asarray(base.convert('RGB')), 0, 0, "background")
 
-    def _initialize_particles(self, width, height):
-        """Parçacıkları başlatır"""
-        for _ in range(50):
-            particle = {
-                'x': random.randint(0, width),
-                'y': random.randint(0, height),
-                'size': random.uniform(1, 3),
-                'speed': random.uniform(0.2, 1.5),
-                'alpha': random.uniform(0.3, 1.0),
-                'id': None
-            }
-            self.particles.append(particle)
+    def _blit_rgb(self, canvas, arr, x, y, tag):
+        """RGB NumPy dizisini tek bir canvas görüntüsü olarak çizer"""
+        photo = ImageTk.PhotoImage(Image.fromarray(arr, 'RGB'))
+        # Tk görüntüsünün çöp toplayıcıya gitmemesi için referans tut
+        self._photos[tag] = photo
+        canvas.create_image(x, y, anchor='nw', image=photo, tags=tag)
 
-    def _create_light_effects(self, width, height):
-        """Dekoratif ışık efektleri oluşturur"""
-        # Üst sağ ışık dairesi
+    def _create_light_overlay(self, width, height):
+        """Dekoratif ışık daireleri ve ışıma efektini yarı saydam katman olarak çizer"""
+        overlay = Image.new('RGBA', (width, height))
+        draw = ImageDraw.Draw(overlay)
         light_radius = width // 6
-        self.canvas.create_oval(width - light_radius * 1.5, -light_radius // 2, 
-                                width + light_radius // 2, light_radius, 
-                                fill="#7986CB", outline="", stipple="gray25")
+        
+        # Üst sağ ışık dairesi
+        draw.ellipse((width - light_radius * 1.5, -light_radius // 2,
+                      width + light_radius // 2, light_radius),
+                     fill=(121, 134, 203, 64))
         
         # Alt sol ışık dairesi
-        self.canvas.create_oval(-light_radius // 2, height - light_radius * 1.2, 
-                                light_radius, height + light_radius // 2, 
-                                fill="#9FA8DA", outline="", stipple="gray25")
+        draw.ellipse((-light_radius // 2, height - light_radius * 1.2,
+                      light_radius, height + light_radius // 2),
+                     fill=(159, 168, 218, 64))
+        
+        # Işıma efekti (alttan yukarı açılan üçgen)
+        draw.polygon([(width / 2, height / 2),
+                      (width / 2 - 200, height),
+                      (width / 2 + 200, height)],
+                     fill=(121, 134, 203, 32))
+        return overlay
+
+    def _initialize_particles(self, width, height):
+        """Parçacıkları ve tek görüntülük çizim katmanını başlatır"""
+        # Parçacık durumu alan başına bir dizi olarak tutulur
+        n = self.PARTICLE_COUNT
+        self.px = self._rng.integers(0, width + 1, n).astype(np.float32)
+        self.py = self._rng.integers(0, height + 1, n).astype(np.float32)
+        self.psize = self._rng.uniform(1, 3, n).astype(np.float32)
+        self.pspeed = self._rng.uniform(0.2, 1.5, n).astype(np.float32)
+        self.palpha = self._rng.uniform(0.3, 1.0, n).astype(np.float32)
+        
+        # Tüm parçacıklar tek bir saydam görüntüye çizilir
+        self._particle_size = (width, height)
+        self._particle_photo = ImageTk.PhotoImage(Image.new('RGBA', self._particle_size))
+        self._particle_item = self.canvas.create_image(0, 0, anchor='nw', image=self._particle_photo)
 
     def _create_logo_section(self, width, height):
-        """Logo bölümünü oluşturur"""
+        """Logo bölümünü oluşturur; görüntü işleme arka planda yapılır"""
+        threading.Thread(
+            target=self._prepare_logo_async,
+            args=(width, height),
+            daemon=True
+        ).start()
+
+    def _prepare_logo_async(self, width, height):
+        """Logo görüntülerini işçi thread'de hazırlar ve kurulumu ana thread'e bırakır"""
         try:
             # Logo yolları
             logo_paths = [
@@ -210,66 +299,102 @@ class SplashScreen:
                 "logo.png"
             ]
             
-            logo_loaded = False
+            # Logo boyutu - daha büyük
+            logo_size = int(min(width, height) * 0.25)
             
             for logo_path in logo_paths:
                 if os.path.exists(logo_path):
                     try:
-                        # Logo'yu işle
-                        orig_img = Image.open(logo_path)
-                        
-                        # Daha iyi görünüm için görüntü işleme
-                        enhancer = ImageEnhance.Sharpness(orig_img)
-                        img = enhancer.enhance(2.0)  # Keskinliği artır
-                        enhancer = ImageEnhance.Brightness(img)
-                        img = enhancer.enhance(1.3)  # Parlaklığı artır
-                        enhancer = ImageEnhance.Contrast(img)
-                        img = enhancer.enhance(1.2)  # Kontrastı artır
-                        
-                        # Logo boyutu - daha büyük
-                        logo_size = int(min(width, height) * 0.25)
-                        img = img.resize((logo_size, logo_size), Image.Resampling.LANCZOS)
-                        
-                        # Etkileyici glow efekti
-                        glow_img = img.filter(ImageFilter.GaussianBlur(radius=15))
-                        glow_img = ImageEnhance.Brightness(glow_img).enhance(1.8)
-                        
-                        # Glow ve logo görüntüleri
-                        self.glow_img = ImageTk.PhotoImage(glow_img)
-                        self.logo_img = ImageTk.PhotoImage(img)
-                        
-                        # Glow efekti arka planda
-                        self.glow_label = tk.Label(
-                            self.splash_window,
-                            image=self.glow_img,
-                            bg='#303F9F'  # Gradient ile uyumlu renk
-                        )
-                        self.glow_label.place(relx=0.5, rely=0.35, anchor="center")
+                        # İşlenmiş logo ve glow (önbellekten veya yeniden)
+                        img, glow_img = self._prepare_logo(logo_path, logo_size)
                         
-                        # Ana logo
-                        self.logo_label = tk.Label(
-                            self.splash_window,
-                            image=self.logo_img,
-                            bg='#303F9F'  # Gradient ile uyumlu renk
-                        )
-                        self.logo_label.place(relx=0.5, rely=0.35, anchor="center")
-                        
-                        # Gelişmiş pulsing animasyonu
-                        self._start_pulse_animation()
-                        
-                        logo_loaded = True
-                        break
+                        # PhotoImage ve widget işlemleri ana thread'de
+                        self.root.after(0, self._install_logo, img, glow_img)
+                        return
                         
                     except Exception as e:
                         logging.warning(f"Logo yükleme hatası ({logo_path}): {str(e)}")
                         continue
             
-            if not logo_loaded:
-                logging.info("Logo dosyası bulunamadı, sadece metin kullanılacak")
+            logging.info("Logo dosyası bulunamadı, sadece metin kullanılacak")
                 
         except Exception as e:
             logging.error(f"Logo bölümü oluşturulurken hata: {str(e)}")
 
+    def _install_logo(self, img, glow_img):
+        """Hazırlanan logo görüntülerini splash penceresine yerleştirir"""
+        if not self._alive:
+            return
+            
+        try:
+            # Glow ve logo görüntüleri
+            self.glow_img = ImageTk.PhotoImage(glow_img)
+            self.logo_img = ImageTk.PhotoImage(img)
+            
+            # Glow efekti arka planda
+            self.glow_label = tk.Label(
+                self.splash_window,
+                image=self.glow_img,
+                bg='#303F9F'  # Gradient ile uyumlu renk
+            )
+            self.glow_label.place(relx=0.5, rely=0.35, anchor="center")
+            
+            # Ana logo
+            self.logo_label = tk.Label(
+                self.splash_window,
+                image=self.logo_img,
+                bg='#303F9F'  # Gradient ile uyumlu renk
+            )
+            self.logo_label.place(relx=0.5, rely=0.35, anchor="center")
+            
+            # Gelişmiş pulsing animasyonu
+            self._start_pulse_animation()
+            
+        except Exception as e:
+            logging.error(f"Logo yerleştirilirken hata: {str(e)}")
+
+    def _prepare_logo(self, logo_path, logo_size):
+        """Logo ve glow görüntülerini hazırlar, sonucu diskte önbellekler"""
+        cache_key = hashlib.md5(
+            f"{LOGO_CACHE_VERSION}:{logo_path}:{os.path.getmtime(logo_path)}:{logo_size}".encode()
+        ).hexdigest()
+        logo_cache = os.path.join(LOGO_CACHE_DIR, f"{cache_key}_logo.png")
+        glow_cache = os.path.join(LOGO_CACHE_DIR, f"{cache_key}_glow.png")
+        
+        # Önbellekte varsa doğrudan yükle
+        if os.path.exists(logo_cache) and os.path.exists(glow_cache):
+            try:
+                return (Image.open(logo_cache).convert('RGBA'),
+                        Image.open(glow_cache).convert('RGBA'))
+            except Exception as e:
+                logging.warning(f"Logo önbelleği okunamadı: {str(e)}")
+        
+        # Daha iyi görünüm için görüntü işleme
+        img = Image.open(logo_path).convert('RGBA')
+        img = ImageEnhance.Sharpness(img).enhance(2.0)  # Keskinliği artır
+        img = img.point(LOGO_TONE_LUT)  # Parlaklık (1.3) + kontrast (1.2), alfa korunur
+        # Kaynak hedef boyuta yakınsa BILINEAR yeterli, değilse BICUBIC
+        resample = (Image.Resampling.BILINEAR if max(img.size) <= logo_size * 2
+                    else Image.Resampling.BICUBIC)
+        img = img.resize((logo_size, logo_size), resample)
+        
+        # Etkileyici glow efekti
+        # Küçült -> küçük yarıçaplı blur -> büyüt (geniş blur yaklaşımı)
+        small = img.resize((max(1, logo_size // 4), max(1, logo_size // 4)), Image.Resampling.BILINEAR)
+        small = small.filter(ImageFilter.GaussianBlur(radius=3))
+        glow_img = small.resize((logo_size, logo_size), Image.Resampling.BILINEAR)
+        glow_img = ImageEnhance.Brightness(glow_img).enhance(1.8)
+        
+        # Sonraki açılışlar için önbelleğe yaz
+        try:
+            os.makedirs(LOGO_CACHE_DIR, exist_ok=True)
+            img.save(logo_cache)
+            glow_img.save(glow_cache)
+        except Exception as e:
+            logging.warning(f"Logo önbelleği yazılamadı: {str(e)}")
+        
+        return img, glow_img
+
     def _create_branding_section(self, width, height):
         """Markalama bölümünü oluşturur"""
         # Markalama bölümü (daha etkileyici)
@@ -287,7 +412,7 @@ class SplashScreen:
         app_name.pack()
         
         # Animasyonlu alt başlık
-        self.subtitle_var = tk.StringVar(value="Akıllı Düşme Algılama Sistemi")
+        self.subtitle_var = tk.StringVar(value=self.SUBTITLES[0])
         app_desc = tk.Label(
             brand_frame,
             textvariable=self.subtitle_var,
@@ -296,9 +421,6 @@ class SplashScreen:
             bg="#303F9F"
         )
         app_desc.pack(pady=(10, 0))
-        
-        # Alt başlık animasyonu
-        self._animate_subtitle()
 
     def _create_progress_section(self, width, height):
         """İlerleme bölümünü oluşturur"""
@@ -328,8 +450,11 @@ class SplashScreen:
         # İlerleme durumu
         self.progress_value = 0
         
+        # Gradient ve parlama şeritlerini bir kez hesapla
+        self._build_progress_strip(int(progress_width), progress_height)
+        
         # İlerleme metni
-        self.loading_var = tk.StringVar(value="Başlatılıyor...")
+        self.loading_var = tk.StringVar(value=self.LOADING_MESSAGES[0])
         loading_label = tk.Label(
             progress_frame,
             textvariable=self.loading_var,
@@ -341,9 +466,28 @@ class SplashScreen:
         
         # İlerleme çubuğu animasyonu
         self._animate_progress_bar()
+
+    def _build_progress_strip(self, width, height):
+        """İlerleme çubuğu gradient ve parlama şeritlerini NumPy ile hazırlar"""
+        # İki segmentli mavi gradient: #64B5F6 -> #1E88E5 -> #1565C0
+        pos = np.arange(width, dtype=np.float32) / max(width, 1)
+        c0 = np.array([100, 181, 246], dtype=np.float32)
+        c1 = np.array([30, 136, 229], dtype=np.float32)
+        c2 = np.array([21, 101, 192], dtype=np.float32)
+        t = np.where(pos < 0.5, pos * 2, (pos - 0.5) * 2)[:, None]
+        cols = np.where(
+            (pos < 0.5)[:, None],
+            (1 - t) * c0 + t * c1,
+            (1 - t) * c1 + t * c2
+        ).astype(np.uint8)
+        self._progress_grad = np.ascontiguousarray(np.broadcast_to(cols, (height, width, 3)))
         
-        # Yükleniyor metni animasyonu
-        self._animate_loading_text()
+        # Parlama: sağ kenarda #90CAF9, sola doğru beyaza açılır
+        glow_width = 20
+        alpha = (1 - np.arange(glow_width, dtype=np.float32) / glow_width)[::-1, None]
+        glow = (alpha * np.array([144, 202, 249], dtype=np.float32) + (1 - alpha) * 255).astype(np.uint8)
+        self._progress_glow = np.ascontiguousarray(np.broadcast_to(glow, (height, glow_width, 3)))
+        self._progress_drawn_width = 0
 
     def _create_footer_section(self, width, height):
         """Footer bölümünü oluşturur"""
@@ -357,80 +501,50 @@ class SplashScreen:
         )
         version.place(relx=0.5, rely=0.92, anchor="center")
 
-    def _create_beam_effect(self, width, height):
-        """Işıma efekti oluşturur"""
-        # Ekstra görsellik: Gelişmiş ışıma efekti
-        light_beam = self.canvas.create_polygon(
-            width/2, height/2,
-            width/2-200, height,
-            width/2+200, height,
-            fill="#7986CB", stipple="gray12"
-        )
-
     def _animate_particles(self):
         """Parçacık animasyonu."""
-        if not self.splash_window or not self.splash_window.winfo_exists():
+        if not self._alive:
             return
             
         try:
-            # Her parçacığı güncelle
-            for particle in self.particles:
-                # Eski parçacığı sil
-                if particle['id']:
-                    self.canvas.delete(particle['id'])
-                
-                # Parçacığı yukarı hareket ettir
-                particle['y'] -= particle['speed']
-                
-                # Ekrandan çıkarsa yeniden konumlandır
-                if particle['y'] < 0:
-                    particle['y'] = self.splash_window.winfo_height() + 5
-                    particle['x'] = random.randint(0, self.splash_window.winfo_width())
-                    particle['alpha'] = random.uniform(0.3, 1.0)
-                    particle['size'] = random.uniform(1, 3)
-                
-                # Parçacığı çiz
-                size = particle['size']
-                particle['id'] = self.canvas.create_oval(
-                    particle['x']-size, particle['y']-size,
-                    particle['x']+size, particle['y']+size,
-                    fill="white", outline=""
-                )
-            
-            # Animasyonu devam ettir
-            if self.splash_window and self.splash_window.winfo_exists():
-                self.splash_window.after(50, self._animate_particles)
-        except:
-            # Pencere kapanmış olabilir
-            pass
-        
-    def _animate_background(self):
-        """Dalgalı arka plan animasyonu."""
-        if not self.splash_window or not self.splash_window.winfo_exists():
-            return
+            width, height = self._particle_size
+            layer = Image.new('RGBA', self._particle_size)
+            draw = ImageDraw.Draw(layer)
+            
+            # Parçacıkları yukarı hareket ettir
+            self.py -= self.pspeed
+            
+            # Ekrandan çıkanları yeniden konumlandır
+            mask = self.py < 0
+            n = int(mask.sum())
+            if n:
+                self.py[mask] = height + 5
+                self.px[mask] = self._rng.integers(0, width + 1, n)
+                self.palpha[mask] = self._rng.uniform(0.3, 1.0, n)
+                self.psize[mask] = self._rng.uniform(1, 3, n)
+            
+            # Parçacıkları katmana çiz
+            x0, y0 = self.px - self.psize, self.py - self.psize
+            x1, y1 = self.px + self.psize, self.py + self.psize
+            fills = (self.palpha * 255).astype(np.uint8).tolist()
+            for box, a in zip(np.stack((x0, y0, x1, y1), axis=1).tolist(), fills):
+                draw.ellipse(box, fill=(255, 255, 255, a))
+            
+            # Mevcut PhotoImage'ı yerinde güncelle
+            self._particle_photo.paste(layer)
             
-        try:
             # Animasyonu devam ettir
-            if self.splash_window and self.splash_window.winfo_exists():
-                self.splash_window.after(100, self._animate_background)
+            self.splash_window.after(50, self._animate_particles)
         except:
             # Pencere kapanmış olabilir
             pass
         
     def _start_pulse_animation(self):
         """Logo için nabız animasyonu."""
-        if not self.splash_window or not self.splash_window.winfo_exists():
+        if not self._alive:
             return
             
         try:
-            # Nabız değişkenleri
-            if not hasattr(self, 'pulse_scale'):
-                self.pulse_scale = 1.0
-                self.pulse_direction = -1
-                self.pulse_min = 0.95
-                self.pulse_max = 1.05
-                self.pulse_step = 0.005
-            
             # Ölçeği güncelle
             self.pulse_scale += self.pulse_step * self.pulse_direction
             
@@ -441,7 +555,7 @@ class SplashScreen:
                 self.pulse_direction = -1
             
             # Glow etiketini güncelle
-            if hasattr(self, 'glow_label') and self.glow_label.winfo_exists():
+            if self.glow_label is not None:
                 # Glow için alfa değerini hesapla
                 alpha = 0.7 + 0.3 * ((self.pulse_scale - self.pulse_min) / (self.pulse_max - self.pulse_min))
                 
@@ -453,58 +567,17 @@ class SplashScreen:
                 # self.glow_label.configure(bg=f"#{r:02x}{g:02x}{b:02x}")
             
             # Animasyonu devam ettir
-            if self.splash_window and self.splash_window.winfo_exists():
-                self.splash_window.after(40, self._start_pulse_animation)
-        except:
-            # Pencere kapanmış olabilir
-            pass
-    
-    def _animate_subtitle(self):
-        """Alt başlık metni animasyonu."""
-        if not self.splash_window or not self.splash_window.winfo_exists():
-            return
-            
-        try:
-            # Metin seçenekleri
-            subtitles = [
-                "Akıllı Düşme Algılama Sistemi",
-                "Güvenliğiniz İçin Geliştirildi", 
-                "7/24 Kesintisiz Koruma",
-                "Hızlı & Anlık Bildirimler",
-                "Yapay Zeka Destekli",
-                "Gerçek Zamanlı İzleme"
-            ]
-            
-            # Metin indeksini takip et
-            if not hasattr(self, 'subtitle_index'):
-                self.subtitle_index = 0
-                self.subtitle_delay = 0
-            
-            # Gecikme sayacını artır
-            self.subtitle_delay += 1
-            
-            # Metin değişimi
-            if self.subtitle_delay >= 25:  # ~2.5 saniye
-                self.subtitle_delay = 0
-                self.subtitle_index = (self.subtitle_index + 1) % len(subtitles)
-                self.subtitle_var.set(subtitles[self.subtitle_index])
-            
-            # Animasyonu devam ettir
-            if self.splash_window and self.splash_window.winfo_exists():
-                self.splash_window.after(100, self._animate_subtitle)
+            self.splash_window.after(40, self._start_pulse_animation)
         except:
             # Pencere kapanmış olabilir
             pass
     
     def _animate_progress_bar(self):
         """İlerleme çubuğu animasyonu."""
-        if not self.splash_window or not self.splash_window.winfo_exists():
+        if not self._alive:
             return
             
         try:
-            # Mevcut ilerleme çubuğunu temizle
-            self.progress_canvas.delete("progress")
-            
             # İlerleme değerini artır
             if self.progress_value < 100:
                 # Gerçekçi ilerleme simülasyonu
@@ -527,108 +600,53 @@ class SplashScreen:
                 # İlerleme çubuğunu çiz
                 bar_width = int(progress_width * (self.progress_value / 100))
                 
-                # Ana ilerleme çubuğu - parlak gradient
-                for i in range(bar_width):
-                    # Pozisyon yüzdesi
-                    pos = i / progress_width if progress_width > 0 else 0
+                # Gradient şeridinden ilgili kısmı al
+                bar_width = min(bar_width, self._progress_grad.shape[1])
+                
+                # Genişlik değişmediyse önceki çizim geçerli
+                if bar_width > 0 and bar_width != self._progress_drawn_width:
+                    self._progress_drawn_width = bar_width
+                    self.progress_canvas.delete("progress")
                     
-                    # Renk gradyasyonu
-                    if pos < 0.5:
-                        t = pos * 2
-                        r1, g1, b1 = 100, 181, 246  # #64B5F6 (açık mavi)
-                        r2, g2, b2 = 30, 136, 229   # #1E88E5 (orta mavi)
-                    else:
-                        t = (pos - 0.5) * 2
-                        r1, g1, b1 = 30, 136, 229   # #1E88E5 (orta mavi)
-                        r2, g2, b2 = 21, 101, 192   # #1565C0 (koyu mavi)
+                    arr = self._progress_grad[:progress_height, :bar_width].copy()
                     
-                    r = int(r1 * (1 - t) + r2 * t)
-                    g = int(g1 * (1 - t) + g2 * t)
-                    b = int(b1 * (1 - t) + b2 * t)
+                    # Parlama efekti - çubuğun sağ kenarında
+                    glow_width = min(self._progress_glow.shape[1], bar_width)
+                    arr[:, bar_width - glow_width:] = self._progress_glow[:progress_height, -glow_width:]
                     
-                    self.progress_canvas.create_line(
-                        i, 0, i, progress_height,
-                        fill=f"#{r:02x}{g:02x}{b:02x}",
-                        tags="progress"
-                    )
-                
-                # Parlama efekti
-                if bar_width > 0:
-                    # Parlama genişliği
-                    glow_width = 20
-                    for i in range(min(glow_width, bar_width)):
-                        # Parlaklık yüzdesi (kenardan uzaklaştıkça azalır)
-                        alpha = 1 - (i / glow_width) if glow_width > 0 else 0
-                        
-                        # Parlak mavi ton
-                        r, g, b = 144, 202, 249  # #90CAF9
-                        
-                        # Parlaklık efekti için renk ayarı
-                        r = int(r * alpha + 255 * (1 - alpha))
-                        g = int(g * alpha + 255 * (1 - alpha))
-                        b = int(b * alpha + 255 * (1 - alpha))
-                        
-                        self.progress_canvas.create_line(
-                            bar_width - i, 0, bar_width - i, progress_height,
-                            fill=f"#{r:02x}{g:02x}{b:02x}",
-                            width=1,
-                            tags="progress"
-                        )
+                    self._blit_rgb(self.progress_canvas, arr, 0, 0, "progress")
             
-            # Animasyonu devam ettir
-            if self.splash_window and self.splash_window.winfo_exists():
-                self.splash_window.after(50, self._animate_progress_bar)
-            
-            # İlerleme tamamlandığında yükleme mesajını değiştir
+            # İlerleme tamamlandığında yükleme mesajını değiştir ve dur
             if self.progress_value >= 100:
                 self.loading_var.set("Hazır... Giriş ekranına yönlendiriliyor")
+                return
+            
+            # Animasyonu devam ettir
+            self.splash_window.after(50, self._animate_progress_bar)
         except:
             # Pencere kapanmış olabilir
             pass
     
-    def _animate_loading_text(self):
-        """Yükleniyor metni animasyonu."""
-        if not self.splash_window or not self.splash_window.winfo_exists():
+    def _tick_ui(self):
+        """Alt başlık ve yükleniyor metni animasyonları için ortak 100 ms zamanlayıcı."""
+        if not self._alive:
             return
             
         try:
-            # Mevcut metni al
-            current_text = self.loading_var.get()
+            self._ui_tick += 1
             
-            # Animasyonu atla
-            if "Hazır" in current_text:
-                if self.splash_window and self.splash_window.winfo_exists():
-                    self.splash_window.after(100, self._animate_loading_text)
-                return
+            # Alt başlık değişimi (~2.5 saniye)
+            if self._ui_tick % 25 == 0:
+                self.subtitle_index = (self.subtitle_index + 1) % len(self.SUBTITLES)
+                self.subtitle_var.set(self.SUBTITLES[self.subtitle_index])
             
-            # Mesaj listesi
-            loading_messages = [
-                "Başlatılıyor...",
-                "Modeller yükleniyor...",
-                "AI sistemi hazırlanıyor...",
-                "Kamera modülü başlatılıyor...",
-                "Ağ bağlantıları kuruluyor...",
-                "Bildirim sistemi yapılandırılıyor...",
-                "Son kontroller yapılıyor..."
-            ]
-            
-            # Mesaj indeksi takip
-            if not hasattr(self, 'message_index'):
-                self.message_index = 0
-                self.message_delay = 0
-            
-            # Gecikme sayacını artır
-            self.message_delay += 1
-            
-            # Mesaj değişimi
-            if self.message_delay >= 15:  # ~1.5 saniye
-                self.message_delay = 0
-                self.message_index = (self.message_index + 1) % len(loading_messages)
-                self.loading_var.set(loading_messages[self.message_index])
+            # Yükleniyor mesajı değişimi (~1.5 saniye), hazır olduktan sonra atlanır
+            if self._ui_tick % 15 == 0 and "Hazır" not in self.loading_var.get():
+                self.message_index = (self.message_index + 1) % len(self.LOADING_MESSAGES)
+                self.loading_var.set(self.LOADING_MESSAGES[self.message_index])
             
             # Animasyonu devam ettir
-            if self.splash_window and self.splash_window.winfo_exists():
-                self.splash_window.after(100, self._animate_loading_text)
+            self.splash_window.after(100, self._tick_ui)
         except:
             # Pencere kapanmış olabilir
             pass
@@ -639,14 +657,39 @@ class SplashScreen:
             logging.info("Splash screen kapatılıyor...")
             
             if self.splash_window and self.splash_window.winfo_exists():
-                # Yumuşak kapanış animasyonu
-                for alpha in range(10, -1, -1):
-                    if self.splash_window and self.splash_window.winfo_exists():
-                        self.splash_window.attributes('-alpha', alpha/10)
-                        self.splash_window.update()
-                        time.sleep(0.02)
+                # Yumuşak kapanış animasyonu (ana döngüyü bloklamadan)
+                self._fade_step(10)
+            else:
+                self._finalize_close()
                 
-                # Splash window'u yok et
+        except Exception as e:
+            logging.error(f"Splash ekranı kapatılırken hata: {str(e)}")
+            self._finalize_close()
+    
+    def _fade_step(self, alpha):
+        """Kapanış animasyonunun tek adımı; bir sonrakini after ile planlar."""
+        # force_close ile zaten kapatılmış olabilir
+        if not self.splash_window:
+            return
+        
+        try:
+            if alpha < 0:
+                self._finalize_close()
+                return
+            
+            self.splash_window.attributes('-alpha', alpha/10)
+            self.splash_window.after(20, self._fade_step, alpha - 1)
+            
+        except Exception as e:
+            logging.error(f"Splash kapanış animasyonu hatası: {str(e)}")
+            self._finalize_close()
+    
+    def _finalize_close(self):
+        """Splash penceresini yok eder, ana pencereyi gösterir ve callback'i çağırır."""
+        try:
+            # Splash window'u yok et
+            self._alive = False
+            if self.splash_window:
                 self.splash_window.destroy()
                 self.splash_window = None
             
@@ -664,6 +707,7 @@ class SplashScreen:
         except Exception as e:
             logging.error(f"Splash ekranı kapatılırken hata: {str(e)}")
             # Hata durumunda temiz bir şekilde kapat
+            self._alive = False
             try:
                 if self.splash_window:
                     self.splash_window.destroy()
@@ -680,6 +724,7 @@ class SplashScreen:
     def force_close(self):
         """Splash ekranını zorla kapatır (acil durum için)"""
         try:
+            self._alive = False
             if self.splash_window:
                 self.splash_window.destroy()
                 self.splash_window = None
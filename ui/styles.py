@@ -16,14 +16,18 @@
 
 import tkinter as tk
 from tkinter import ttk
+import sys
 import logging
+import functools
+import weakref
+from types import MappingProxyType
 from config.settings import Settings
 
 class GuardStyles:
     """Guard uygulaması için stil tanımları"""
     
-    # Renk paletleri
-    COLORS = {
+    # Renk paletleri (salt okunur)
+    COLORS = MappingProxyType({
         'primary': '#2196F3',           # Ana mavi
         'primary_dark': '#1976D2',      # Koyu mavi
         'primary_light': '#BBDEFB',     # Açık mavi
@@ -52,10 +56,10 @@ class GuardStyles:
         'border_dark': '#BDBDBD',       # Koyu kenarlık
         
         'shadow': '#00000020'           # Gölge (alpha)
-    }
+    })
     
     # Dark mode renkleri
-    DARK_COLORS = {
+    DARK_COLORS = MappingProxyType({
         'primary': '#1E88E5',
         'primary_dark': '#1565C0',
         'primary_light': '#2196F3',
@@ -84,10 +88,10 @@ class GuardStyles:
         'border_dark': '#444444',       # Daha koyu kenarlık
         
         'shadow': '#00000040'           # Koyu gölge
-    }
+    })
     
     # Font ayarları
-    FONTS = {
+    FONTS = MappingProxyType({
         'default': ('Segoe UI', 9),
         'small': ('Segoe UI', 8),
         'medium': ('Segoe UI', 10),
@@ -103,10 +107,10 @@ class GuardStyles:
         'monospace': ('Consolas', 9),
         'monospace_small': ('Consolas', 8),
         'monospace_large': ('Consolas', 12)
-    }
+    })
     
     # Boyutlar ve padding
-    DIMENSIONS = {
+    DIMENSIONS = MappingProxyType({
         'padding_small': 5,
         'padding_medium': 10,
         'padding_large': 15,
@@ -130,22 +134,189 @@ class GuardStyles:
         'icon_medium': 24,
         'icon_large': 32,
         'icon_xlarge': 48
-    }
+    })
+
+_DEFAULT_FONT = GuardStyles.FONTS['default']
+
+# Uygulama teması -> tercih sırasına göre ttk temaları
+_PREFERRED = {
+    'dark': ('equilux', 'clam', 'default'),
+    'light': ('vista', 'clam', 'default')
+}
+
+# Yüklü ttk temaları (root -> tema adları); root yok olunca kayıt düşer
+_theme_names = weakref.WeakKeyDictionary()
+
+def _available_themes(style):
+    """Yüklü ttk temalarını döndürür; Tcl çağrısı yorumlayıcı (root) başına bir kez yapılır"""
+    root = style.master
+    themes = _theme_names.get(root)
+    if themes is None:
+        themes = _theme_names[root] = frozenset(style.theme_names())
+    return themes
+
+# Özel ttk stil adları (bir kez intern edilip her yerde aynı nesne kullanılır)
+_STYLE_NAMES = tuple(sys.intern(name) for name in (
+    'Title.TLabel',
+    'Heading.TLabel',
+    'Subheading.TLabel',
+    'Success.TLabel',
+    'Warning.TLabel',
+    'Error.TLabel',
+    'Info.TLabel',
+    'Primary.TButton',
+    'Success.TButton',
+    'Warning.TButton',
+    'Danger.TButton',
+    'Large.TButton',
+    'Card.TFrame',
+    'Large.TEntry'
+))
+(
+    TITLE_LABEL,
+    HEADING_LABEL,
+    SUBHEADING_LABEL,
+    SUCCESS_LABEL,
+    WARNING_LABEL,
+    ERROR_LABEL,
+    INFO_LABEL,
+    PRIMARY_BUTTON,
+    SUCCESS_BUTTON,
+    WARNING_BUTTON,
+    DANGER_BUTTON,
+    LARGE_BUTTON,
+    CARD_FRAME,
+    LARGE_ENTRY
+) = _STYLE_NAMES
+
+def _build_spec(colors):
+    """Verilen renk paletiyle (stil adı, ayarlar) listesini oluşturur"""
+    fonts = GuardStyles.FONTS
+    dims = GuardStyles.DIMENSIONS
+    
+    # Sık kullanılan renkler
+    fg = colors['text_primary']
+    bg = colors['background']
+    bg_dark = colors['background_dark']
+    primary = colors['primary']
+    
+    return (
+        # Başlık stilleri
+        (TITLE_LABEL, {'font': fonts['title'], 'foreground': fg}),
+        (HEADING_LABEL, {'font': fonts['heading'], 'foreground': fg}),
+        (SUBHEADING_LABEL, {'font': fonts['subheading'], 'foreground': fg}),
+        
+        # Durum stilleri
+        (SUCCESS_LABEL, {'font': fonts['medium'], 'foreground': colors['secondary']}),
+        (WARNING_LABEL, {'font': fonts['medium'], 'foreground': colors['warning']}),
+        (ERROR_LABEL, {'font': fonts['medium'], 'foreground': colors['error']}),
+        (INFO_LABEL, {'font': fonts['medium'], 'foreground': primary}),
+        
+        # Buton stilleri - Large/Primary/Success/Warning/Danger.TButton
+        # font ve padding'i ttk stil kalıtımıyla TButton'dan alır
+        ('TButton', {'font': fonts['button'], 'padding': dims['button_padding']}),
+        
+        # Frame stilleri
+        (CARD_FRAME, {'relief': 'solid', 'borderwidth': 1}),
+        
+        # Entry stilleri
+        (LARGE_ENTRY, {'font': fonts['medium'], 'fieldbackground': bg}),
+        
+        # Notebook stilleri
+        ('TNotebook', {'background': bg}),
+        ('TNotebook.Tab', {'font': fonts['medium'],
+                           'padding': [dims['padding_medium'], dims['padding_small']]}),
+        
+        # Progressbar stilleri
+        ('TProgressbar', {'background': primary, 'troughcolor': bg_dark}),
+        
+        # LabelFrame stilleri
+        ('TLabelframe', {'background': bg, 'relief': 'solid', 'borderwidth': 1}),
+        ('TLabelframe.Label', {'font': fonts['subheading'], 'foreground': fg}),
+        
+        # Scale stilleri
+        ('TScale', {'background': primary, 'troughcolor': bg_dark}),
+        
+        # Checkbutton / Radiobutton stilleri
+        ('TCheckbutton', {'font': fonts['medium'], 'foreground': fg}),
+        ('TRadiobutton', {'font': fonts['medium'], 'foreground': fg}),
+        
+        # Treeview stilleri
+        ('Treeview', {'font': fonts['default'], 'background': bg,
+                      'foreground': fg, 'fieldbackground': bg}),
+        ('Treeview.Heading', {'font': fonts['subheading'], 'background': bg_dark,
+                              'foreground': fg}),
+    )
+
+def _tcl_word(value):
+    """Python değerini Tcl betiğinde tek kelime olacak şekilde yazar"""
+    if isinstance(value, (tuple, list)):
+        return '{' + ' '.join(_tcl_word(v) for v in value) + '}'
+    text = str(value)
+    if not text or any(c in text for c in ' \t\n;"$[]\\'):
+        return '{' + text + '}'
+    return text
+
+def _spec_to_tcl(spec):
+    """Stil tablosunu tek bir 'ttk::style configure' betiğine çevirir"""
+    return '\n'.join(
+        f"ttk::style configure {name} " + ' '.join(f"-{k} {_tcl_word(v)}" for k, v in options.items())
+        for name, options in spec
+    )
+
+# Stil türü -> ttk stil adı eşlemeleri
+_BUTTON_STYLES = {
+    'primary': PRIMARY_BUTTON,
+    'success': SUCCESS_BUTTON,
+    'warning': WARNING_BUTTON,
+    'danger': DANGER_BUTTON,
+    'large': LARGE_BUTTON
+}
+
+_LABEL_STYLES = {
+    'title': TITLE_LABEL,
+    'heading': HEADING_LABEL,
+    'subheading': SUBHEADING_LABEL,
+    'success': SUCCESS_LABEL,
+    'warning': WARNING_LABEL,
+    'error': ERROR_LABEL,
+    'info': INFO_LABEL
+}
+
+# Stil tabloları import sırasında bir kez hesaplanır
+_SPEC_LIGHT = _build_spec(GuardStyles.COLORS)
+_SPEC_DARK = _build_spec(GuardStyles.DARK_COLORS)
+_SCRIPT_LIGHT = _spec_to_tcl(_SPEC_LIGHT)
+_SCRIPT_DARK = _spec_to_tcl(_SPEC_DARK)
+
+@functools.lru_cache(maxsize=128)
+def _lookup_color(theme: str, color_name: str) -> str:
+    """Tema ve renk adına göre renk kodunu döndürür (paletler salt okunur olduğu için önbelleklenir)"""
+    palette = GuardStyles.DARK_COLORS if theme == "dark" else GuardStyles.COLORS
+    return palette.get(color_name, '#000000')
 
 class StyleManager:
     """Stil yöneticisi sınıfı"""
     
+    __slots__ = ('current_theme', 'style', 'colors', '_font_get', '_dim_get')
+    
     def __init__(self):
         """Stil yöneticisini başlatır"""
         self.current_theme = Settings.THEME_MODE
         self.style = None
         self.colors = self._get_color_scheme()
         
+        # Sık kullanılan sözlük erişimleri için bağlı .get metotları
+        self._font_get = GuardStyles.FONTS.get
+        self._dim_get = GuardStyles.DIMENSIONS.get
+        
         logging.info(f"StyleManager başlatıldı - Tema: {self.current_theme}")
     
-    def _get_color_scheme(self):
-        """Mevcut temaya göre renk şemasını döndürür"""
-        if self.current_theme == "dark":
+    def _get_color_scheme(self, theme=None):
+        """Temaya (varsayılan: mevcut tema) göre salt okunur renk şemasını döndürür"""
+        if theme is None:
+            theme = self.current_theme
+        if theme == "dark":
             return GuardStyles.DARK_COLORS
         else:
             return GuardStyles.COLORS
@@ -166,312 +337,114 @@ class StyleManager:
         except Exception as e:
             logging.error(f"Stil ayarlama hatası: {str(e)}")
     
+    def _resolve_base_theme(self):
+        """Mevcut temaya uygun, yüklü ttk temasının adını döndürür"""
+        # Mevcut temalar (süreç boyunca değişmez, önbellekten)
+        available_themes = _available_themes(self.style)
+        preferred = _PREFERRED.get(self.current_theme, _PREFERRED['light'])
+        return next((name for name in preferred if name in available_themes), 'default')
+    
     def _configure_theme(self):
         """Temel temayı yapılandırır"""
-        try:
-            # Mevcut temaları listele
-            available_themes = self.style.theme_names()
-            
-            # Tema seçimi
-            if self.current_theme == "dark":
-                if 'equilux' in available_themes:
-                    self.style.theme_use('equilux')
-                elif 'clam' in available_themes:
-                    self.style.theme_use('clam')
-                else:
-                    self.style.theme_use('default')
-            else:
-                if 'vista' in available_themes:
-                    self.style.theme_use('vista')
-                elif 'clam' in available_themes:
-                    self.style.theme_use('clam')
-                else:
-                    self.style.theme_use('default')
-                    
-            logging.info(f"Tema ayarlandı: {self.style.theme_use()}")
-            
-        except Exception as e:
-            logging.warning(f"Tema ayarlama hatası: {str(e)}")
-            self.style.theme_use('default')
+        self.style.theme_use(self._resolve_base_theme())
+        logging.info(f"Tema ayarlandı: {self.style.theme_use()}")
+    
+    def _current_spec(self):
+        """Mevcut temanın stil tablosunu döndürür"""
+        return _SPEC_DARK if self.current_theme == "dark" else _SPEC_LIGHT
     
     def _define_custom_styles(self):
         """Özel stilleri tanımlar"""
+        dark = self.current_theme == "dark"
+        
+        # Tüm stiller tek Tcl betiğiyle, tek çağrıda kurulur
         try:
-            # Başlık stilleri
-            self.style.configure(
-                'Title.TLabel',
-                font=GuardStyles.FONTS['title'],
-                foreground=self.colors['text_primary']
-            )
-            
-            self.style.configure(
-                'Heading.TLabel',
-                font=GuardStyles.FONTS['heading'],
-                foreground=self.colors['text_primary']
-            )
-            
-            self.style.configure(
-                'Subheading.TLabel',
-                font=GuardStyles.FONTS['subheading'],
-                foreground=self.colors['text_primary']
-            )
-            
-            # Durum stilleri
-            self.style.configure(
-                'Success.TLabel',
-                font=GuardStyles.FONTS['medium'],
-                foreground=self.colors['secondary']
-            )
-            
-            self.style.configure(
-                'Warning.TLabel',
-                font=GuardStyles.FONTS['medium'],
-                foreground=self.colors['warning']
-            )
-            
-            self.style.configure(
-                'Error.TLabel',
-                font=GuardStyles.FONTS['medium'],
-                foreground=self.colors['error']
-            )
-            
-            self.style.configure(
-                'Info.TLabel',
-                font=GuardStyles.FONTS['medium'],
-                foreground=self.colors['primary']
-            )
-            
-            # Buton stilleri
-            self.style.configure(
-                'Large.TButton',
-                font=GuardStyles.FONTS['button'],
-                padding=GuardStyles.DIMENSIONS['button_padding']
-            )
-            
-            self.style.configure(
-                'Primary.TButton',
-                font=GuardStyles.FONTS['button'],
-                padding=GuardStyles.DIMENSIONS['button_padding']
-            )
-            
-            self.style.configure(
-                'Success.TButton',
-                font=GuardStyles.FONTS['button'],
-                padding=GuardStyles.DIMENSIONS['button_padding']
-            )
-            
-            self.style.configure(
-                'Warning.TButton',
-                font=GuardStyles.FONTS['button'],
-                padding=GuardStyles.DIMENSIONS['button_padding']
-            )
-            
-            self.style.configure(
-                'Danger.TButton',
-                font=GuardStyles.FONTS['button'],
-                padding=GuardStyles.DIMENSIONS['button_padding']
-            )
-            
-            # Frame stilleri
-            self.style.configure(
-                'Card.TFrame',
-                relief='solid',
-                borderwidth=1
-            )
-            
-            # Entry stilleri
-            self.style.configure(
-                'Large.TEntry',
-                font=GuardStyles.FONTS['medium'],
-                fieldbackground=self.colors['background']
-            )
-            
-            # Notebook stilleri
-            self.style.configure(
-                'TNotebook',
-                background=self.colors['background']
-            )
-            
-            self.style.configure(
-                'TNotebook.Tab',
-                font=GuardStyles.FONTS['medium'],
-                padding=[GuardStyles.DIMENSIONS['padding_medium'], 
-                        GuardStyles.DIMENSIONS['padding_small']]
-            )
-            
-            # Progressbar stilleri
-            self.style.configure(
-                'TProgressbar',
-                background=self.colors['primary'],
-                troughcolor=self.colors['background_dark']
-            )
-            
-            # LabelFrame stilleri
-            self.style.configure(
-                'TLabelframe',
-                background=self.colors['background'],
-                relief='solid',
-                borderwidth=1
-            )
-            
-            self.style.configure(
-                'TLabelframe.Label',
-                font=GuardStyles.FONTS['subheading'],
-                foreground=self.colors['text_primary']
-            )
-            
-            # Scale stilleri
-            self.style.configure(
-                'TScale',
-                background=self.colors['primary'],
-                troughcolor=self.colors['background_dark']
-            )
-            
-            # Checkbutton stilleri
-            self.style.configure(
-                'TCheckbutton',
-                font=GuardStyles.FONTS['medium'],
-                foreground=self.colors['text_primary']
-            )
-            
-            # Radiobutton stilleri
-            self.style.configure(
-                'TRadiobutton',
-                font=GuardStyles.FONTS['medium'],
-                foreground=self.colors['text_primary']
-            )
-            
-            # Treeview stilleri
-            self.style.configure(
-                'Treeview',
-                font=GuardStyles.FONTS['default'],
-                background=self.colors['background'],
-                foreground=self.colors['text_primary'],
-                fieldbackground=self.colors['background']
-            )
-            
-            self.style.configure(
-                'Treeview.Heading',
-                font=GuardStyles.FONTS['subheading'],
-                background=self.colors['background_dark'],
-                foreground=self.colors['text_primary']
-            )
-            
-        except Exception as e:
-            logging.error(f"Özel stil tanımlama hatası: {str(e)}")
+            self.style.tk.eval(_SCRIPT_DARK if dark else _SCRIPT_LIGHT)
+            return
+        except tk.TclError as e:
+            logging.warning(f"Toplu stil tanımlama başarısız, tek tek denenecek: {str(e)}")
+        
+        configure = self.style.configure
+        for style_name, options in self._current_spec():
+            configure(style_name, **options)
     
     def get_color(self, color_name: str) -> str:
         """Renk kodunu döndürür"""
-        return self.colors.get(color_name, '#000000')
+        return _lookup_color(self.current_theme, color_name)
     
     def get_font(self, font_name: str) -> tuple:
         """Font bilgisini döndürür"""
-        return GuardStyles.FONTS.get(font_name, GuardStyles.FONTS['default'])
+        return self._font_get(font_name, _DEFAULT_FONT)
     
     def get_dimension(self, dimension_name: str) -> int:
         """Boyut değerini döndürür"""
-        return GuardStyles.DIMENSIONS.get(dimension_name, 10)
+        return self._dim_get(dimension_name, 10)
     
     def apply_button_style(self, button, style_type: str = 'default'):
         """Butona özel stil uygular"""
-        try:
-            style_configs = {
-                'primary': {
-                    'style': 'Primary.TButton'
-                },
-                'success': {
-                    'style': 'Success.TButton'
-                },
-                'warning': {
-                    'style': 'Warning.TButton'
-                },
-                'danger': {
-                    'style': 'Danger.TButton'
-                },
-                'large': {
-                    'style': 'Large.TButton'
-                }
-            }
-            
-            config = style_configs.get(style_type, {})
-            if 'style' in config:
-                button.configure(style=config['style'])
-                
-        except Exception as e:
-            logging.error(f"Buton stil uygulama hatası: {str(e)}")
+        style_name = _BUTTON_STYLES.get(style_type)
+        if style_name:
+            button.configure(style=style_name)
     
     def apply_label_style(self, label, style_type: str = 'default'):
         """Etikete özel stil uygular"""
-        try:
-            style_configs = {
-                'title': {
-                    'style': 'Title.TLabel'
-                },
-                'heading': {
-                    'style': 'Heading.TLabel'
-                },
-                'subheading': {
-                    'style': 'Subheading.TLabel'
-                },
-                'success': {
-                    'style': 'Success.TLabel'
-                },
-                'warning': {
-                    'style': 'Warning.TLabel'
-                },
-                'error': {
-                    'style': 'Error.TLabel'
-                },
-                'info': {
-                    'style': 'Info.TLabel'
-                }
-            }
-            
-            config = style_configs.get(style_type, {})
-            if 'style' in config:
-                label.configure(style=config['style'])
-                
-        except Exception as e:
-            logging.error(f"Etiket stil uygulama hatası: {str(e)}")
+        style_name = _LABEL_STYLES.get(style_type)
+        if style_name:
+            label.configure(style=style_name)
     
     def create_card_frame(self, parent, **kwargs):
         """Kart görünümünde frame oluşturur"""
-        try:
-            frame = ttk.Frame(parent, style='Card.TFrame', **kwargs)
-            return frame
-        except Exception as e:
-            logging.error(f"Card frame oluşturma hatası: {str(e)}")
-            return ttk.Frame(parent, **kwargs)
+        return ttk.Frame(parent, style=CARD_FRAME, **kwargs)
     
     def update_theme(self, new_theme: str):
         """Temayı değiştirir"""
+        # Tema aynıysa renkler ve stiller zaten güncel
+        if new_theme == self.current_theme:
+            return
+        
         try:
+            old_spec = self._current_spec()
+            
+            # Renkler salt okunur bir anlık görüntüdür; önce hazırlanıp tek atamayla değiştirilir,
+            # böylece colors'ı yerel değişkene alan okuyucular kilitsiz tutarlı bir palet görür
+            colors = self._get_color_scheme(new_theme)
             self.current_theme = new_theme
-            self.colors = self._get_color_scheme()
+            self.colors = colors
+            
+            # Önceki temayla kurulmuş pencere kayıtları artık geçersiz
+            _installed.clear()
             
             if self.style:
-                self._configure_theme()
-                self._define_custom_styles()
+                if self._resolve_base_theme() != self.style.theme_use():
+                    # ttk teması değişiyor, tüm stiller yeniden kurulmalı
+                    self._configure_theme()
+                    self._define_custom_styles()
+                else:
+                    # Aynı ttk teması: yalnızca ayarları değişen stilleri güncelle
+                    for (style_name, options), (_, old_options) in zip(self._current_spec(), old_spec):
+                        if options != old_options:
+                            self.style.configure(style_name, **options)
             
             logging.info(f"Tema güncellendi: {new_theme}")
             
         except Exception as e:
             logging.error(f"Tema güncelleme hatası: {str(e)}")
 
-# Global stil yöneticisi
-_style_manager = None
-
-def get_style_manager():
+# Global stil yöneticisi (testlerde get_style_manager.cache_clear() ile sıfırlanabilir)
+@functools.cache
+def get_style_manager() -> StyleManager:
     """Global stil yöneticisini döndürür"""
-    global _style_manager
-    if _style_manager is None:
-        _style_manager = StyleManager()
-    return _style_manager
+    return StyleManager()
+
+# Stilleri kurulmuş pencereler (pencere -> kurulduğu tema); pencere yok olunca kayıt düşer
+_installed = weakref.WeakKeyDictionary()
 
 def setup_window_styles(root):
-    """Pencere için stilleri ayarlar"""
+    """Pencere için stilleri ayarlar (aynı tema zaten kuruluysa tekrar kurmaz)"""
     style_manager = get_style_manager()
-    style_manager.setup_styles(root)
+    if _installed.get(root) != style_manager.current_theme:
+        style_manager.setup_styles(root)
+        _installed[root] = style_manager.current_theme
     return style_manager
 
 def apply_guard_theme(root):
@@ -497,49 +470,49 @@ def get_emoji_font():
     """Emoji fontu döndürür"""
     return ('Segoe UI Emoji', 12)
 
-def create_tooltip_style():
-    """Tooltip stili oluşturur"""
-    return {
+def _build_tooltip_style(colors):
+    """Verilen renk paletiyle salt okunur tooltip stilini oluşturur"""
+    return MappingProxyType({
         'font': GuardStyles.FONTS['small'],
-        'bg': GuardStyles.COLORS['background_dark'],
-        'fg': GuardStyles.COLORS['text_primary'],
+        'bg': colors['background_dark'],
+        'fg': colors['text_primary'],
         'relief': 'solid',
         'borderwidth': 1
-    }
+    })
+
+_TOOLTIP_STYLE_LIGHT = _build_tooltip_style(GuardStyles.COLORS)
+_TOOLTIP_STYLE_DARK = _build_tooltip_style(GuardStyles.DARK_COLORS)
+
+def create_tooltip_style(theme='light'):
+    """Tooltip stilini döndürür (salt okunur; değiştirmek için dict(...) ile kopyalanmalı)"""
+    return _TOOLTIP_STYLE_DARK if theme == 'dark' else _TOOLTIP_STYLE_LIGHT
+
+# Tüm kenarları sıfır olan paylaşılan padding
+_ZERO_PAD = MappingProxyType({'padx': (0, 0), 'pady': (0, 0)})
+
+def _pad(top=0, right=None, bottom=None, left=None, /):
+    """CSS padding/margin benzeri (padx, pady) ayarlarını döndürür"""
+    if not top and right is None and bottom is None and left is None:
+        return _ZERO_PAD
+    
+    right = top if right is None else right
+    bottom = top if bottom is None else bottom
+    left = right if left is None else left
+    
+    return MappingProxyType({
+        'padx': (left, right),
+        'pady': (top, bottom)
+    })
 
 # CSS benzeri yardımcı sınıf
 class CSSHelper:
     """CSS benzeri stil yardımcıları"""
     
-    @staticmethod
-    def padding(top=0, right=None, bottom=None, left=None):
-        """CSS padding benzeri"""
-        if right is None:
-            right = top
-        if bottom is None:
-            bottom = top
-        if left is None:
-            left = right
-        
-        return {
-            'padx': (left, right),
-            'pady': (top, bottom)
-        }
+    # CSS padding benzeri
+    padding = staticmethod(_pad)
     
-    @staticmethod
-    def margin(top=0, right=None, bottom=None, left=None):
-        """CSS margin benzeri"""
-        if right is None:
-            right = top
-        if bottom is None:
-            bottom = top
-        if left is None:
-            left = right
-        
-        return {
-            'padx': (left, right),
-            'pady': (top, bottom)
-        }
+    # CSS margin benzeri (Tk'da padding ile aynı ayarlara karşılık gelir)
+    margin = padding
 
 # Test fonksiyonu
 def test_styles():
@@ -20,36 +20,66 @@ import psutil
 import socket
 import hashlib
 import uuid
+import secrets
 import json
 import re
+import functools
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Union, Any, Tuple
 import subprocess
 import shutil
 import threading
+import queue
+import heapq
+import signal
+from array import array
+from collections import defaultdict
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 import time
 import cv2
 import numpy as np
 from urllib.parse import urlparse
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Platform bilgisi süreç boyunca değişmez; bir kez hesaplanır
+_IS_WINDOWS = os.name == 'nt'
+_DISK_ROOT = 'C:\\' if _IS_WINDOWS else '/'
+_NETSTAT_CMD = ('netstat', '-ano', '-p', 'TCP')
+
+@functools.lru_cache(maxsize=1)
+def _static_system_info() -> Dict[str, Any]:
+    """Süreç boyunca değişmeyen sistem bilgilerini döndürür (bir kez hesaplanır)"""
+    return {
+        'platform': platform.platform(),
+        'system': platform.system(),
+        'release': platform.release(),
+        'version': platform.version(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'python_version': platform.python_version(),
+        'cpu_count': psutil.cpu_count(),
+        'memory_total_gb': round(psutil.virtual_memory().total / (1024**3), 2)
+    }
 
 def get_system_info() -> Dict[str, Any]:
     """Sistem bilgilerini döndürür"""
     try:
-        return {
-            'platform': platform.platform(),
-            'system': platform.system(),
-            'release': platform.release(),
-            'version': platform.version(),
-            'machine': platform.machine(),
-            'processor': platform.processor(),
-            'python_version': platform.python_version(),
-            'cpu_count': psutil.cpu_count(),
-            'memory_total_gb': round(psutil.virtual_memory().total / (1024**3), 2),
-            'disk_free_gb': round(shutil.disk_usage('/').free / (1024**3), 2) if os.name != 'nt' 
-                           else round(shutil.disk_usage('C:').free / (1024**3), 2)
-        }
+        info = dict(_static_system_info())
+        info['disk_free_gb'] = round(shutil.disk_usage(_DISK_ROOT).free / (1024**3), 2)
+        return info
     except Exception as e:
         return {'error': str(e)}
 
@@ -76,27 +106,49 @@ def get_network_info() -> Dict[str, Any]:
     except Exception as e:
         return {'error': str(e)}
 
+# Bağlantı kontrolü için ortak oturum (keep-alive ile TLS el sıkışması tekrarlanmaz)
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
 def check_internet_connection(timeout: int = 5) -> bool:
     """Internet bağlantısını kontrol eder"""
+    # Art arda gelen çağrılar 30 saniye boyunca önbellekten yanıtlanır
+    cached = _helper_cache.get('internet_connected')
+    if cached is not None:
+        return cached
+    
     try:
-        requests.get('https://www.google.com', timeout=timeout)
-        return True
+        _SESSION.head('https://www.google.com', timeout=timeout)
+        connected = True
     except requests.RequestException:
-        return False
+        connected = False
+    
+    _helper_cache.set('internet_connected', connected, ttl=30)
+    return connected
 
+# Doğrulama desenleri (modül yüklenirken bir kez derlenir)
+# Doğrulayıcılar saf fonksiyonlardır; tekrar eden girdiler sınırlı LRU önbellekten döner
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# Basit regex - gerçek uygulamada daha kapsamlı olabilir
+_PHONE_RE = re.compile(r'^\+?[1-9]\d{1,14}$')
+_PHONE_STRIP_RE = re.compile(r'[^\d+]')
+
+@functools.lru_cache(maxsize=4096)
 def validate_email(email: str) -> bool:
     """E-posta adresini doğrular"""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    # '@' içermeyen veya çok kısa adresleri regex'e girmeden ele
+    if len(email) < 6 or '@' not in email:
+        return False
+    return _EMAIL_RE.match(email) is not None
 
+@functools.lru_cache(maxsize=4096)
 def validate_phone_number(phone: str) -> bool:
     """Telefon numarasını doğrular (uluslararası format)"""
-    # Basit regex - gerçek uygulamada daha kapsamlı olabilir
-    pattern = r'^\+?[1-9]\d{1,14}$'
     # Sadece rakam ve + karakterini al
-    clean_phone = re.sub(r'[^\d+]', '', phone)
-    return re.match(pattern, clean_phone) is not None
+    clean_phone = _PHONE_STRIP_RE.sub('', phone)
+    return _PHONE_RE.match(clean_phone) is not None
 
+@functools.lru_cache(maxsize=1024)
 def validate_url(url: str) -> bool:
     """URL'nin geçerli olup olmadığını kontrol eder"""
     try:
@@ -149,18 +201,77 @@ def generate_unique_id() -> str:
     return str(uuid.uuid4())
 
 def generate_short_id(length: int = 8) -> str:
-    """Kısa benzersiz ID oluşturur"""
-    import random
-    import string
-    return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
+    """Kısa benzersiz ID oluşturur (URL ve dosya adı güvenli)"""
+    # Her karakter 6 bit taşır; length bayt fazlasıyla yeterli
+    return secrets.token_urlsafe(length)[:length]
+
+# Dosya hash'i için okuma tampon boyutu
+_HASH_BUFFER_SIZE = 1 << 20
 
-def calculate_file_hash(file_path: str, algorithm: str = 'md5') -> Optional[str]:
+def _new_hash(algorithm: str):
+    """Algoritma adına göre hash nesnesi oluşturur (blake3 opsiyonel)"""
+    if algorithm == 'blake3':
+        if blake3 is None:
+            raise ValueError("blake3 paketi yüklü değil")
+        return blake3.blake3()
+    # OpenSSL arka ucu destekleyen CPU'larda SHA donanım komutlarını kullanır
+    return hashlib.new(algorithm)
+
+def _hash_pipelined(f, hash_algo):
+    """Okuma ve hash işlemini iki tampon ile üst üste bindirir"""
+    free_buffers = queue.Queue()
+    filled = queue.Queue()
+    for _ in range(2):
+        free_buffers.put(bytearray(_HASH_BUFFER_SIZE))
+
+    def reader():
+        try:
+            while True:
+                buf = free_buffers.get()
+                n = f.readinto(buf)
+                filled.put((buf, n))
+                if not n:
+                    break
+        except Exception as e:
+            filled.put((None, e))
+
+    thread = threading.Thread(target=reader, daemon=True)
+    thread.start()
+    # update() GIL'i bıraktığından okuma iş parçacığı paralel ilerler
+    while True:
+        buf, n = filled.get()
+        if buf is None:
+            raise n
+        if not n:
+            break
+        hash_algo.update(memoryview(buf)[:n])
+        free_buffers.put(buf)
+    thread.join()
+    return hash_algo
+
+def calculate_file_hash(file_path: str, algorithm: str = 'sha256') -> Optional[str]:
     """Dosyanın hash değerini hesaplar"""
     try:
-        hash_algo = hashlib.new(algorithm)
         with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_algo.update(chunk)
+            fd = f.fileno()
+            if hasattr(os, 'posix_fadvise'):
+                # Çekirdeğe sıralı okuma yapılacağını bildir (readahead)
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            if os.fstat(fd).st_size > 2 * _HASH_BUFFER_SIZE:
+                # Büyük dosyalarda disk okuması ile hash hesabı paralel yürür
+                return _hash_pipelined(f, _new_hash(algorithm)).hexdigest()
+            if hasattr(hashlib, 'file_digest'):
+                # Python 3.11+: büyük tamponlu readinto döngüsü C tarafında
+                return hashlib.file_digest(f, lambda: _new_hash(algorithm)).hexdigest()
+            hash_algo = _new_hash(algorithm)
+            # 1 MiB tampon; her parça için yeni bytes nesnesi oluşturulmaz
+            buf = bytearray(_HASH_BUFFER_SIZE)
+            view = memoryview(buf)
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                hash_algo.update(view[:n])
         return hash_algo.hexdigest()
     except Exception:
         return None
@@ -173,19 +284,35 @@ def safe_json_load(file_path: str) -> Optional[Dict]:
     except Exception:
         return None
 
+def _dump_json_bytes(data: Dict) -> bytes:
+    """Veriyi girintili UTF-8 JSON baytlarına çevirir (orjson varsa onu kullanır)"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # orjson'un desteklemediği tipler için standart json'a düş
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
 def safe_json_save(data: Dict, file_path: str) -> bool:
     """JSON verilerini güvenli şekilde kaydeder"""
     try:
         # Dizini oluştur
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
         
-        # Önce geçici dosyaya yaz
+        # Önce geçici dosyaya yaz ve diske işlendiğinden emin ol
         temp_path = f"{file_path}.tmp"
-        with open(temp_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        payload = _dump_json_bytes(data)
+        fd = os.open(temp_path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
         
-        # Başarılıysa asıl dosyaya taşı
-        shutil.move(temp_path, file_path)
+        # Başarılıysa asıl dosyanın yerine atomik olarak koy
+        os.replace(temp_path, file_path)
         return True
     except Exception:
         return False
@@ -198,23 +325,44 @@ def ensure_directory(directory: str) -> bool:
     except Exception:
         return False
 
-def get_available_cameras() -> List[int]:
-    """Kullanılabilir kamera indekslerini döndürür"""
-    available_cameras = []
-    
-    for i in range(10):  # 0-9 arası kontrol et
+def _camera_backend() -> int:
+    """Platforma göre hızlı açılan kamera arka ucunu döndürür"""
+    if sys.platform == 'win32':
+        return cv2.CAP_DSHOW
+    if sys.platform.startswith('linux'):
+        return cv2.CAP_V4L2
+    return cv2.CAP_ANY
+
+def _probe_camera(index: int) -> bool:
+    """Verilen indeksteki kameranın frame verip vermediğini kontrol eder"""
+    try:
+        cap = cv2.VideoCapture(index, _camera_backend())
         try:
-            cap = cv2.VideoCapture(i)
             if cap.isOpened():
                 # Test frame'i al
                 ret, _ = cap.read()
-                if ret:
-                    available_cameras.append(i)
+                return bool(ret)
+            return False
+        finally:
             cap.release()
-        except Exception:
-            continue
+    except Exception:
+        return False
+
+def get_available_cameras() -> List[int]:
+    """Kullanılabilir kamera indekslerini döndürür"""
+    indices = range(10)  # 0-9 arası kontrol et
     
-    return available_cameras
+    if sys.platform.startswith('linux') and os.path.isdir('/dev'):
+        # Aygıt dosyası olmayan indeksleri hiç açmaya çalışma
+        indices = [i for i in indices if os.path.exists(f'/dev/video{i}')]
+        if not indices:
+            return []
+    
+    # Her indeks bağımsız; yoklamaları paralel yap
+    with ThreadPoolExecutor(max_workers=len(indices)) as executor:
+        results = executor.map(_probe_camera, indices)
+    
+    return [i for i, ok in zip(indices, results) if ok]
 
 def test_camera(camera_index: int, timeout: int = 5) -> Dict[str, Any]:
     """Kamerayı test eder"""
@@ -265,6 +413,12 @@ def resize_image_keep_aspect(image: np.ndarray, target_width: int, target_height
             new_height = target_height
             new_width = int(target_height * aspect_ratio)
         
+        # Büyük küçültmelerde önce SIMD hızlandırmalı pyrDown ile yarıya indir;
+        # INTER_AREA kalan (en az 2x) küçültmeyi yapar
+        while w // 2 >= 2 * new_width and h // 2 >= 2 * new_height:
+            image = cv2.pyrDown(image)
+            h, w = image.shape[:2]
+        
         return cv2.resize(image, (new_width, new_height), interpolation=cv2.INTER_AREA)
         
     except Exception:
@@ -277,30 +431,83 @@ def create_thumbnail(image: np.ndarray, size: Tuple[int, int] = (150, 150)) -> n
     except Exception:
         return image
 
-def is_port_available(port: int, host: str = 'localhost') -> bool:
+def is_port_available(port: int, host: str = 'localhost', timeout: float = 1.0) -> bool:
     """Port'un kullanılabilir olup olmadığını kontrol eder"""
     try:
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.settimeout(1)
+            s.settimeout(timeout)
             result = s.connect_ex((host, port))
             return result != 0  # 0 = bağlantı başarılı (port kullanımda)
     except Exception:
         return False
 
-def find_free_port(start_port: int = 8000, end_port: int = 9000) -> Optional[int]:
-    """Boş port bulur"""
+def get_ephemeral_port() -> int:
+    """İşletim sisteminin atadığı boş bir portu döndürür"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(('', 0))
+        return s.getsockname()[1]
+
+def _can_bind(port: int) -> bool:
+    """Portun yerel olarak bağlanabilir (boş) olup olmadığını tek syscall ile kontrol eder"""
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.bind(('', port))
+            return True
+    except OSError:
+        return False
+
+def find_free_port(start_port: Optional[int] = 8000, end_port: int = 9000) -> Optional[int]:
+    """Boş port bulur (start_port verilmezse işletim sistemi seçer)"""
+    if not start_port:
+        try:
+            return get_ephemeral_port()
+        except OSError:
+            return None
+    
+    # Geniş aralıklarda önce çekirdeğin verdiği portlardan aralığa düşeni ara
+    if end_port - start_port >= 1024:
+        for _ in range(100):
+            try:
+                port = get_ephemeral_port()
+            except OSError:
+                break
+            if start_port <= port < end_port:
+                return port
+    
+    # Dar aralık veya eşleşme yok: bind denemesiyle sırayla tara (bağlantı timeout'u yok)
     for port in range(start_port, end_port):
-        if is_port_available(port):
+        if _can_bind(port):
             return port
     return None
 
+def _listening_pids(port: int) -> Optional[set]:
+    """Portu dinleyen process ID'lerini psutil ile bulur (yetki yoksa None)"""
+    try:
+        return {
+            conn.pid for conn in psutil.net_connections(kind='tcp')
+            if conn.pid and conn.laddr and conn.laddr.port == port
+            and conn.status == psutil.CONN_LISTEN
+        }
+    except (psutil.AccessDenied, NotImplementedError):
+        return None
+
 def kill_process_on_port(port: int) -> bool:
     """Belirtilen portu kullanan process'i sonlandırır"""
     try:
-        if platform.system() == "Windows":
+        # Önce süreç içinden dene - netstat/lsof başlatmaya gerek kalmaz
+        pids = _listening_pids(port)
+        if pids is not None:
+            for pid in pids:
+                try:
+                    psutil.Process(pid).kill()
+                except psutil.NoSuchProcess:
+                    pass
+            return bool(pids)
+        
+        if _IS_WINDOWS:
             # Windows için netstat kullan
             result = subprocess.run(
-                ["netstat", "-ano", "-p", "TCP"],
+                _NETSTAT_CMD,
                 capture_output=True,
                 text=True
             )
@@ -333,10 +540,11 @@ def kill_process_on_port(port: int) -> bool:
 def debounce(wait_time: float):
     """Debounce decorator - fonksiyonun çok sık çağrılmasını önler"""
     def decorator(func):
-        last_called = [0]
+        last_called = [float('-inf')]
         
         def wrapper(*args, **kwargs):
-            current_time = time.time()
+            # Monotonik saat: sistem saati geri alınsa da doğru çalışır
+            current_time = time.monotonic()
             if current_time - last_called[0] >= wait_time:
                 last_called[0] = current_time
                 return func(*args, **kwargs)
@@ -344,20 +552,27 @@ def debounce(wait_time: float):
         return wrapper
     return decorator
 
-def throttle(calls_per_second: float):
-    """Throttle decorator - fonksiyonun saniyede max çağrı sayısını sınırlar"""
+def throttle(calls_per_second: float, burst: Optional[float] = None):
+    """Throttle decorator - fonksiyonun saniyede max çağrı sayısını sınırlar (token bucket)"""
     def decorator(func):
-        min_interval = 1.0 / calls_per_second
-        last_called = [0]
+        capacity = burst if burst is not None else max(1.0, calls_per_second)
+        # [jeton sayısı, son güncelleme zamanı]
+        state = [capacity, time.monotonic()]
         
         def wrapper(*args, **kwargs):
-            current_time = time.time()
-            elapsed = current_time - last_called[0]
+            now = time.monotonic()
+            tokens = min(capacity, state[0] + (now - state[1]) * calls_per_second)
             
-            if elapsed < min_interval:
-                time.sleep(min_interval - elapsed)
+            if tokens >= 1.0:
+                # Kova doluyken çağrı beklemeden yapılır
+                state[0] = tokens - 1.0
+                state[1] = now
+            else:
+                # Sadece jeton yetmediğinde bir sonraki jetonu bekle
+                time.sleep((1.0 - tokens) / calls_per_second)
+                state[0] = 0.0
+                state[1] = time.monotonic()
             
-            last_called[0] = time.time()
             return func(*args, **kwargs)
         
         return wrapper
@@ -384,31 +599,64 @@ def retry(max_attempts: int = 3, delay: float = 1.0, backoff: float = 2.0):
         return wrapper
     return decorator
 
+def _can_use_alarm() -> bool:
+    """SIGALRM tabanlı zaman aşımının kullanılabilir olup olmadığını kontrol eder"""
+    return (hasattr(signal, 'setitimer')
+            and threading.current_thread() is threading.main_thread()
+            and signal.getitimer(signal.ITIMER_REAL)[0] == 0)
+
+def _run_with_thread_timeout(func, args, kwargs, seconds: float):
+    """Fonksiyonu çağrıya özel daemon thread'de çalıştırır ve süre dolunca TimeoutError fırlatır"""
+    future = Future()
+    
+    def target():
+        # Zaman aşımından sonra iptal edilmişse hiç çalıştırma
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+    
+    threading.Thread(target=target, daemon=True, name='guard-timeout').start()
+    try:
+        return future.result(timeout=seconds)
+    except FuturesTimeoutError:
+        future.cancel()
+        raise TimeoutError(f"Function timed out after {seconds} seconds")
+
 def timeout(seconds: float):
     """Timeout decorator - fonksiyonun belirli sürede tamamlanmasını sağlar"""
     def decorator(func):
         def wrapper(*args, **kwargs):
-            result = [None]
-            exception = [None]
-            
-            def target():
-                try:
-                    result[0] = func(*args, **kwargs)
-                except Exception as e:
-                    exception[0] = e
+            if not _can_use_alarm():
+                # Windows veya yan thread: çağrıya özel daemon thread
+                return _run_with_thread_timeout(func, args, kwargs, seconds)
             
-            thread = threading.Thread(target=target)
-            thread.daemon = True
-            thread.start()
-            thread.join(seconds)
+            # POSIX ana thread: ek thread olmadan zamanlayıcı sinyali
+            fired = False
             
-            if thread.is_alive():
+            def handler(signum, frame):
+                nonlocal fired
+                fired = True
                 raise TimeoutError(f"Function timed out after {seconds} seconds")
             
-            if exception[0]:
-                raise exception[0]
+            previous = signal.signal(signal.SIGALRM, handler)
+            signal.setitimer(signal.ITIMER_REAL, seconds)
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as e:
+                if fired and not isinstance(e, TimeoutError):
+                    raise TimeoutError(f"Function timed out after {seconds} seconds") from e
+                raise
+            finally:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+                signal.signal(signal.SIGALRM, previous)
             
-            return result[0]
+            # func TimeoutError'ı kendi içinde yuttuysa bile çağırana bildir
+            if fired:
+                raise TimeoutError(f"Function timed out after {seconds} seconds")
+            return result
         
         return wrapper
     return decorator
@@ -487,40 +735,49 @@ class PerformanceMonitor:
     """Performans izleme sınıfı"""
     
     def __init__(self):
-        self.metrics = {}
+        # Süreler nanosaniye olarak paketli int64 dizilerde tutulur
+        self.metrics = defaultdict(lambda: array('q'))
         self.start_times = {}
     
     def start_timer(self, name: str):
         """Timer başlatır"""
-        self.start_times[name] = time.time()
+        self.start_times[name] = time.perf_counter_ns()
     
     def end_timer(self, name: str) -> float:
         """Timer'ı bitirir ve süreyi döndürür"""
-        if name in self.start_times:
-            duration = time.time() - self.start_times[name]
-            
-            if name not in self.metrics:
-                self.metrics[name] = []
-            
-            self.metrics[name].append(duration)
-            del self.start_times[name]
-            
-            return duration
-        return 0.0
+        start = self.start_times.pop(name, None)
+        if start is None:
+            return 0.0
+        
+        duration_ns = time.perf_counter_ns() - start
+        self.metrics[name].append(duration_ns)
+        return duration_ns / 1e9
+    
+    @contextmanager
+    def timed(self, name: str):
+        """Blok süresini ölçen context manager"""
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.metrics[name].append(time.perf_counter_ns() - start)
     
     def get_stats(self, name: str) -> Dict[str, float]:
         """Performans istatistiklerini döndürür"""
-        if name not in self.metrics or not self.metrics[name]:
+        times = self.metrics.get(name)
+        if not times:
             return {}
         
-        times = self.metrics[name]
+        # Dizi kopyalanmadan numpy ile özetlenir
+        values = np.frombuffer(times, dtype=np.int64)
+        total = int(values.sum())
         return {
             'count': len(times),
-            'total': sum(times),
-            'average': sum(times) / len(times),
-            'min': min(times),
-            'max': max(times),
-            'last': times[-1]
+            'total': total / 1e9,
+            'average': total / len(times) / 1e9,
+            'min': int(values.min()) / 1e9,
+            'max': int(values.max()) / 1e9,
+            'last': times[-1] / 1e9
         }
     
     def reset_metrics(self, name: str = None):
@@ -538,6 +795,8 @@ class DataCache:
         self.cache = {}
         self.timestamps = {}
         self.default_ttl = default_ttl
+        # (bitiş zamanı, anahtar) min-heap; eski kayıtlar tembel olarak atılır
+        self._expiry_heap = []
     
     def get(self, key: str) -> Optional[Any]:
         """Önbellekten veri alır"""
@@ -553,8 +812,15 @@ class DataCache:
     
     def set(self, key: str, value: Any, ttl: int = None):
         """Önbelleğe veri ekler"""
+        expire_time = time.monotonic() + (ttl or self.default_ttl)
         self.cache[key] = value
-        self.timestamps[key] = time.time() + (ttl or self.default_ttl)
+        self.timestamps[key] = expire_time
+        heapq.heappush(self._expiry_heap, (expire_time, key))
+        
+        # Sık güncellenen anahtarlar heap'i şişirmesin
+        if len(self._expiry_heap) > 2 * len(self.timestamps) + 64:
+            self._expiry_heap = [(t, k) for k, t in self.timestamps.items()]
+            heapq.heapify(self._expiry_heap)
     
     def delete(self, key: str):
         """Önbellekten veri siler"""
@@ -565,33 +831,35 @@ class DataCache:
         """Önbelleği temizler"""
         self.cache.clear()
         self.timestamps.clear()
+        self._expiry_heap.clear()
     
     def _is_expired(self, key: str) -> bool:
         """Verinin süresi dolmuş mu kontrol eder"""
-        return time.time() > self.timestamps.get(key, 0)
+        return time.monotonic() > self.timestamps.get(key, 0)
     
     def cleanup_expired(self):
         """Süresi dolmuş verileri temizler"""
-        current_time = time.time()
-        expired_keys = [
-            key for key, expire_time in self.timestamps.items()
-            if current_time > expire_time
-        ]
+        current_time = time.monotonic()
+        heap = self._expiry_heap
+        expired_count = 0
         
-        for key in expired_keys:
-            self.delete(key)
+        # Yalnızca süresi dolmuş kayıtlar heap'in başından çekilir
+        while heap and heap[0][0] < current_time:
+            expire_time, key = heapq.heappop(heap)
+            # Anahtar silinmiş veya yeniden set edilmişse kayıt eskidir
+            if self.timestamps.get(key) == expire_time:
+                self.delete(key)
+                expired_count += 1
         
-        return len(expired_keys)
+        return expired_count
+
+# Geçersiz karakterler ve boşluk -> alt çizgi (tek geçişte çeviri tablosu)
+_SANITIZE_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?* '})
 
 def sanitize_filename(filename: str) -> str:
     """Dosya adını güvenli hale getirir"""
-    # Geçersiz karakterleri kaldır
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
-    
-    # Boşlukları alt çizgi ile değiştir
-    filename = filename.replace(' ', '_')
+    # Geçersiz karakterleri ve boşlukları alt çizgi ile değiştir
+    filename = filename.translate(_SANITIZE_TABLE)
     
     # Maksimum uzunluk kontrolü
     if len(filename) > 255:
@@ -600,33 +868,38 @@ def sanitize_filename(filename: str) -> str:
     
     return filename
 
-def compress_image(image: np.ndarray, quality: int = 85) -> bytes:
-    """Görüntüyü sıkıştırır"""
+def compress_image(image: np.ndarray, quality: int = 85, zero_copy: bool = False) -> Union[bytes, memoryview]:
+    """Görüntüyü sıkıştırır (zero_copy=True ise kopyalamadan memoryview döndürür)"""
     try:
-        encode_param = [cv2.IMWRITE_JPEG_QUALITY, quality]
+        # Ek optimizasyon/progressive geçişleri kapalı - tek geçişte kodla
+        encode_param = [cv2.IMWRITE_JPEG_QUALITY, quality,
+                        cv2.IMWRITE_JPEG_OPTIMIZE, 0,
+                        cv2.IMWRITE_JPEG_PROGRESSIVE, 0]
         success, img_encoded = cv2.imencode('.jpg', image, encode_param)
         
         if success:
-            return img_encoded.tobytes()
+            # memoryview doğrudan sock.sendall()/write() ile gönderilebilir
+            return memoryview(img_encoded) if zero_copy else img_encoded.tobytes()
         return b''
     except Exception:
         return b''
 
 def get_local_ip_addresses() -> List[str]:
     """Tüm yerel IP adreslerini döndürür"""
+    # Arayüzler nadiren değişir; kısa süreli önbellekten dön
+    cached = _helper_cache.get('local_ip_addresses')
+    if cached is not None:
+        return list(cached)
+    
     ip_addresses = []
     
     try:
-        # Platform bağımsız yöntem
-        hostname = socket.gethostname()
-        ip_addresses.append(socket.gethostbyname(hostname))
-        
-        # Tüm network interface'leri kontrol et
-        if hasattr(socket, 'AF_INET'):
-            for interface in socket.getaddrinfo(hostname, None):
-                ip = interface[4][0]
-                if ip not in ip_addresses and not ip.startswith('127.'):
-                    ip_addresses.append(ip)
+        # Arayüz adresleri doğrudan çekirdekten (DNS sorgusu yok)
+        for addrs in psutil.net_if_addrs().values():
+            for addr in addrs:
+                if (addr.family == socket.AF_INET and not addr.address.startswith('127.')
+                        and addr.address not in ip_addresses):
+                    ip_addresses.append(addr.address)
     
     except Exception:
         pass
@@ -635,36 +908,67 @@ def get_local_ip_addresses() -> List[str]:
     if not ip_addresses:
         ip_addresses.append('127.0.0.1')
     
+    _helper_cache.set('local_ip_addresses', tuple(ip_addresses), ttl=5)
     return ip_addresses
 
 def bytes_to_human_readable(bytes_value: int) -> str:
     """Byte değerini okunabilir formata çevirir"""
     return format_file_size(bytes_value)
 
+# Boyut birimleri (human_readable_to_bytes için)
+_UNITS = {'B': 1, 'KB': 1024, 'MB': 1024**2, 'GB': 1024**3, 'TB': 1024**4}
+_NUMBER_CHARS = frozenset('0123456789.')
+
 def human_readable_to_bytes(human_readable: str) -> int:
     """Okunabilir formatı byte'a çevirir"""
     try:
-        units = {'B': 1, 'KB': 1024, 'MB': 1024**2, 'GB': 1024**3, 'TB': 1024**4}
+        text = human_readable.upper()
         
-        # Sayı ve birimi ayır
-        import re
-        match = re.match(r'([0-9.]+)\s*([A-Z]+)', human_readable.upper())
+        # Sayı ve birimi tek geçişte ayır
+        i = 0
+        while i < len(text) and text[i] in _NUMBER_CHARS:
+            i += 1
+        unit = text[i:].lstrip()
+        j = 0
+        while j < len(unit) and 'A' <= unit[j] <= 'Z':
+            j += 1
         
-        if match:
-            value = float(match.group(1))
-            unit = match.group(2)
-            
-            if unit in units:
-                return int(value * units[unit])
+        if i and unit[:j] in _UNITS:
+            return int(float(text[:i]) * _UNITS[unit[:j]])
         
         return 0
     except Exception:
         return 0
 
+# Arka planda örneklenen son CPU yüzdesi (None = henüz örnek yok)
+_LAST_CPU_PCT = None
+_cpu_sampler_lock = threading.Lock()
+_cpu_sampler_started = False
+
+def _cpu_sampler():
+    """CPU kullanımını saniyede bir örnekler"""
+    global _LAST_CPU_PCT
+    while True:
+        try:
+            # Bekleme bu thread'de yapılır, çağıranı bloklamaz
+            _LAST_CPU_PCT = psutil.cpu_percent(interval=1)
+        except Exception:
+            time.sleep(1)
+
 def get_cpu_usage() -> float:
     """CPU kullanım yüzdesini döndürür"""
+    global _cpu_sampler_started
     try:
-        return psutil.cpu_percent(interval=1)
+        if not _cpu_sampler_started:
+            with _cpu_sampler_lock:
+                if not _cpu_sampler_started:
+                    threading.Thread(target=_cpu_sampler, name='guard-cpu-sampler', daemon=True).start()
+                    _cpu_sampler_started = True
+        
+        if _LAST_CPU_PCT is None:
+            # İlk çağrı: örnekleyici hazır olana kadar kısa bir ölçüm yap
+            return psutil.cpu_percent(interval=0.1)
+        return _LAST_CPU_PCT
     except Exception:
         return 0.0
 
@@ -684,8 +988,8 @@ def get_memory_usage() -> Dict[str, float]:
 def get_disk_usage(path: str = '/') -> Dict[str, float]:
     """Disk kullanım bilgilerini döndürür"""
     try:
-        if os.name == 'nt':  # Windows
-            path = 'C:\\'
+        if _IS_WINDOWS:
+            path = _DISK_ROOT
         
         usage = shutil.disk_usage(path)
         return {
@@ -701,6 +1005,9 @@ def get_disk_usage(path: str = '/') -> Dict[str, float]:
 _performance_monitor = PerformanceMonitor()
 _data_cache = DataCache()
 
+# Modül içi kısa süreli önbellek (get_data_cache() ile paylaşılmaz; kullanıcı verisiyle çakışmaz)
+_helper_cache = DataCache()
+
 def get_performance_monitor() -> PerformanceMonitor:
     """Global performance monitor'ı döndürür"""
     return _performance_monitor
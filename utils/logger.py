@@ -15,239 +15,473 @@
 
 import logging
 import logging.handlers
+import atexit
+import copy
+import io
+import functools
+import queue
 import os
 import sys
-import traceback
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
 import json
 
 from config.settings import Settings
 
+# Hızlı JSON serileştirici seçimi: orjson > ujson > standart json
+try:
+    import orjson
+    _dumps_bytes = orjson.dumps
+    _dumps = lambda obj: orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    orjson = None
+    try:
+        import ujson as _json_impl
+    except ImportError:
+        _json_impl = json
+    _dumps = lambda obj: _json_impl.dumps(obj, ensure_ascii=False)
+    _dumps_bytes = lambda obj: _dumps(obj).encode('utf-8')
+
+# LogRecord'un standart alanları - JSON çıktısına "extra" olarak eklenmez
+_STD_LOGRECORD_ATTRS = frozenset({
+    'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
+    'filename', 'module', 'exc_info', 'exc_text', 'stack_info',
+    'lineno', 'funcName', 'created', 'msecs', 'relativeCreated',
+    'thread', 'threadName', 'processName', 'process', 'message'
+})
+
+# JSON kaydının sabit alanları - aynı adlı extra alanlar 'extra_' önekiyle yazılır
+_JSON_CORE_FIELDS = frozenset({
+    'timestamp', 'level', 'logger', 'message', 'module', 'function', 'line', 'exception'
+})
+
+# ANSI renk kodları - seviye numarasıyla (levelno) doğrudan indekslenir
+_COLOR_RESET = '\033[0m'
+_LEVEL_COLORS = [_COLOR_RESET] * (logging.CRITICAL + 1)
+_LEVEL_COLORS[logging.DEBUG] = '\033[36m'      # Cyan
+_LEVEL_COLORS[logging.INFO] = '\033[32m'       # Green
+_LEVEL_COLORS[logging.WARNING] = '\033[33m'    # Yellow
+_LEVEL_COLORS[logging.ERROR] = '\033[31m'      # Red
+_LEVEL_COLORS[logging.CRITICAL] = '\033[35m'   # Magenta
+
 class ColoredFormatter(logging.Formatter):
     """Renkli konsol çıktısı için formatter"""
     
-    # ANSI renk kodları
-    COLORS = {
-        'DEBUG': '\033[36m',      # Cyan
-        'INFO': '\033[32m',       # Green
-        'WARNING': '\033[33m',    # Yellow
-        'ERROR': '\033[31m',      # Red
-        'CRITICAL': '\033[35m',   # Magenta
-        'RESET': '\033[0m'        # Reset
-    }
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Renkli seviye adları bir kez hazırlanır
+        self._colored = [
+            f"{color}{logging.getLevelName(levelno)}{_COLOR_RESET}"
+            for levelno, color in enumerate(_LEVEL_COLORS)
+        ]
     
     def format(self, record):
         # Renk kodunu ekle
-        log_color = self.COLORS.get(record.levelname, self.COLORS['RESET'])
-        record.levelname = f"{log_color}{record.levelname}{self.COLORS['RESET']}"
+        levelname = record.levelname
+        levelno = record.levelno
+        if 0 <= levelno < len(self._colored):
+            record.levelname = self._colored[levelno]
         
-        # Formatter'ı uygula
-        return super().format(record)
+        # Formatter'ı uygula; kayıt diğer handler'lar için eski haline döner
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
+
+# Platform kontrolü - Windows'da renk desteği (import sırasında bir kez karar verilir)
+_USE_COLORS = sys.platform != "win32"
+if not _USE_COLORS:
+    try:
+        import colorama
+        colorama.init()
+        _USE_COLORS = True
+    except ImportError:
+        pass
+
+_CONSOLE_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+_CONSOLE_FORMATTER = (ColoredFormatter if _USE_COLORS else logging.Formatter)(
+    _CONSOLE_FORMAT, datefmt='%H:%M:%S'
+)
+
+# JsonFormatter'ın thread başına yeniden kullandığı kayıt sözlüğü
+_json_local = threading.local()
+
+@functools.lru_cache(maxsize=256)
+def _iso_seconds(seconds: int) -> str:
+    """Saniye hassasiyetinde ISO-8601 zaman damgası (aynı saniyedeki kayıtlar paylaşır)"""
+    return datetime.fromtimestamp(seconds).strftime('%Y-%m-%dT%H:%M:%S')
 
 class JsonFormatter(logging.Formatter):
     """JSON formatında log çıktısı"""
     
     def format(self, record):
-        log_entry = {
-            'timestamp': datetime.fromtimestamp(record.created).isoformat(),
-            'level': record.levelname,
-            'logger': record.name,
-            'message': record.getMessage(),
-            'module': record.module,
-            'function': record.funcName,
-            'line': record.lineno
-        }
+        return _dumps(self._build_entry(record))
+    
+    def format_bytes(self, record) -> bytes:
+        """Kaydı doğrudan UTF-8 JSON baytlarına çevirir (orjson ile decode/encode yok)"""
+        return _dumps_bytes(self._build_entry(record))
+    
+    def _build_entry(self, record) -> dict:
+        """Kayıttan JSON'a yazılacak sözlüğü oluşturur (thread'e özel, bir sonraki çağrıya kadar geçerli)"""
+        # Serileştiriciler sözlüğe referans tutmaz; her kayıtta yeni sözlük ayırmak yerine yeniden kullanılır
+        log_entry = getattr(_json_local, 'entry', None)
+        if log_entry is None:
+            log_entry = _json_local.entry = {}
+        log_entry.clear()
+        
+        # orjson datetime'ı yerel olarak serileştirir; diğerlerinde saniye kısmı önbellekten gelir
+        log_entry['timestamp'] = (datetime.fromtimestamp(record.created) if orjson is not None
+                                  else f"{_iso_seconds(int(record.created))}.{int(record.msecs):03d}")
+        log_entry['level'] = record.levelname
+        log_entry['logger'] = record.name
+        log_entry['message'] = record.getMessage()
+        log_entry['module'] = record.module
+        log_entry['function'] = record.funcName
+        log_entry['line'] = record.lineno
         
-        # Exception bilgisi varsa ekle
+        # Exception bilgisi varsa ekle (traceback metni kayıtta saklanır, diğer handler'lar tekrar üretmez)
         if record.exc_info:
-            log_entry['exception'] = self.formatException(record.exc_info)
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            log_entry['exception'] = record.exc_text
         
-        # Extra alanları ekle
-        for key, value in record.__dict__.items():
-            if key not in ['name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
-                          'filename', 'module', 'exc_info', 'exc_text', 'stack_info',
-                          'lineno', 'funcName', 'created', 'msecs', 'relativeCreated',
-                          'thread', 'threadName', 'processName', 'process', 'message']:
-                log_entry[key] = value
+        # Extra alanları ekle - GuardLogger bunları tek bir 'extras' sözlüğünde taşır
+        record_dict = record.__dict__
+        extras = record_dict.get('extras')
+        if extras is not None:
+            if extras.keys().isdisjoint(_JSON_CORE_FIELDS):
+                log_entry.update(extras)
+            else:
+                # Sabit alanlar ezilmez; çakışan anahtarlar önekle korunur
+                for key, value in extras.items():
+                    log_entry[f'extra_{key}' if key in _JSON_CORE_FIELDS else key] = value
+        else:
+            # Diğer logger'lardan gelen kayıtlar: standart alanlar küme farkıyla elenir
+            for key in record_dict.keys() - _STD_LOGRECORD_ATTRS:
+                log_entry[f'extra_{key}' if key in _JSON_CORE_FIELDS else key] = record_dict[key]
         
-        return json.dumps(log_entry, ensure_ascii=False)
+        return log_entry
 
-class GuardLogger:
-    """Guard uygulaması için özel logger sınıfı"""
+# Log dosyaları için yazma tamponu boyutu
+_FILE_BUFFER_SIZE = 64 * 1024
+
+class BufferedRotatingHandler(logging.Handler):
+    """64 KB tamponlu, boyutu kendi sayan rotating dosya handler'ı (format_bytes destekleyen formatter'lar bayt yazar)"""
     
-    def __init__(self, name: str = "guard"):
-        """Logger'ı başlatır"""
-        self.name = name
-        self.logger = logging.getLogger(name)
-        self.logger.setLevel(logging.DEBUG)
-        
-        # Duplicate handler'ları önle
-        if self.logger.handlers:
-            self.logger.handlers.clear()
-        
-        self._setup_handlers()
+    def __init__(self, filename: str, maxBytes: int = 0, backupCount: int = 0,
+                 encoding: str = 'utf-8', buffer_size: int = _FILE_BUFFER_SIZE,
+                 flush_level: int = logging.ERROR):
+        super().__init__()
+        self.baseFilename = os.path.abspath(filename)
+        self.maxBytes = maxBytes
+        self.backupCount = backupCount
+        self.encoding = encoding
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        self._buffer = None
+        self._size = 0
+        self._open()
+    
+    def _open(self):
+        """Dosyayı ekleme modunda tamponlu olarak açar"""
+        raw = io.FileIO(self.baseFilename, 'ab')
+        # Dosya boyutu bir kez okunur, sonrası yazılan bayt sayısıyla izlenir (tell() yok)
+        self._size = os.fstat(raw.fileno()).st_size
+        self._buffer = io.BufferedWriter(raw, self.buffer_size)
+    
+    def _rollover(self):
+        """Dosyayı .1, .2 ... şeklinde döndürür"""
+        self._buffer.close()
+        for i in range(self.backupCount - 1, 0, -1):
+            source = f"{self.baseFilename}.{i}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.baseFilename}.{i + 1}")
+        os.replace(self.baseFilename, f"{self.baseFilename}.1")
+        self._open()
+    
+    def emit(self, record):
+        try:
+            # JsonFormatter gibi bayt üreten formatter'larda metin katmanı atlanır
+            format_bytes = getattr(self.formatter, 'format_bytes', None)
+            if format_bytes is not None:
+                data = format_bytes(record) + b'\n'
+            else:
+                data = (self.format(record) + '\n').encode(self.encoding)
+            if self._buffer is None:
+                self._open()
+            if (self.maxBytes > 0 and self.backupCount > 0
+                    and self._size + len(data) >= self.maxBytes):
+                self._rollover()
+            
+            self._buffer.write(data)
+            self._size += len(data)
+            
+            # Hata kayıtları beklemeden diske iner
+            if record.levelno >= self.flush_level:
+                self._buffer.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self):
+        self.acquire()
+        try:
+            if self._buffer is not None:
+                self._buffer.flush()
+        finally:
+            self.release()
+    
+    def close(self):
+        self.acquire()
+        try:
+            if self._buffer is not None:
+                self._buffer.close()
+                self._buffer = None
+        finally:
+            self.release()
+        super().close()
+
+class _GuardQueueHandler(logging.handlers.QueueHandler):
+    """Kayıtları arka plan thread'ine aktaran kuyruk handler'ı"""
+    
+    def prepare(self, record):
+        # Mesajı çağıran thread'de oluştur (args sonradan değişebilir);
+        # kuyruk süreç içi olduğundan exc_info korunur, formatlama hedef handler'lara kalır
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+# Tüm GuardLogger'lar tek handler kümesini paylaşır; kümeye yalnızca 'guard' logger'ı bağlanır,
+# diğer isimler 'guard.<isim>' alt logger'ı olarak kayıtlarını ona iletir
+_ROOT_LOGGER_NAME = 'guard'
+_handlers_lock = threading.Lock()
+_queue_handler = None
+_listener = None
+
+def _logger_name(name: str) -> str:
+    """GuardLogger adını 'guard' hiyerarşisindeki stdlib logger adına çevirir"""
+    if name == _ROOT_LOGGER_NAME or name.startswith(_ROOT_LOGGER_NAME + '.'):
+        return name
+    return f"{_ROOT_LOGGER_NAME}.{name}"
+
+def _buffered(target: logging.Handler, capacity: int = 1024) -> logging.Handler:
+    """Dosya handler'ını kayıtları toplu yazan MemoryHandler ile sarar"""
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity,
+        flushLevel=logging.ERROR,  # Hatalar beklemeden diske yazılır
+        target=target,
+        flushOnClose=True
+    )
+    # MemoryHandler flush sırasında seviye kontrolü yapmaz; hedefin seviyesini taşı
+    memory_handler.setLevel(target.level)
+    return memory_handler
+
+def _console_handler():
+    """Konsol çıktısı handler'ı"""
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(logging.INFO)
+    console_handler.setFormatter(_CONSOLE_FORMATTER)
+    return console_handler
+
+def _file_handler():
+    """Dosya çıktısı handler'ı"""
+    file_handler = BufferedRotatingHandler(
+        Settings.LOG_FILE_PATH,
+        maxBytes=Settings.LOG_MAX_SIZE,
+        backupCount=Settings.LOG_BACKUP_COUNT,
+        encoding='utf-8'
+    )
+    file_handler.setLevel(logging.DEBUG)
+    
+    formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(module)s:%(lineno)d - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    file_handler.setFormatter(formatter)
+    return _buffered(file_handler)
+
+def _error_handler():
+    """Hata dosyası handler'ı"""
+    error_file = "logs/guard_errors.log"
+    error_handler = BufferedRotatingHandler(
+        error_file,
+        maxBytes=5 * 1024 * 1024,  # 5MB
+        backupCount=3,
+        encoding='utf-8'
+    )
+    error_handler.setLevel(logging.ERROR)
+    
+    formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(module)s:%(lineno)d\n'
+        'Message: %(message)s\n'
+        'Function: %(funcName)s\n'
+        '%(pathname)s:%(lineno)d\n'
+        '%(exc_text)s\n' + '-'*50,
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    error_handler.setFormatter(formatter)
+    return error_handler
+
+def _json_handler():
+    """JSON formatı handler'ı"""
+    json_file = "logs/guard_json.log"
+    json_handler = BufferedRotatingHandler(
+        json_file,
+        maxBytes=10 * 1024 * 1024,  # 10MB
+        backupCount=2
+    )
+    json_handler.setLevel(logging.DEBUG)
+    
+    formatter = JsonFormatter()
+    json_handler.setFormatter(formatter)
+    return _buffered(json_handler)
+
+def _start_handlers():
+    """Ortak handler'ları ve kuyruk dinleyicisini süreçte bir kez kurar"""
+    global _queue_handler, _listener
+    
+    with _handlers_lock:
+        if _listener is not None:
+            return
         
-    def _setup_handlers(self):
-        """Handler'ları ayarlar"""
         # Logs dizini oluştur
-        logs_dir = Path("logs")
-        logs_dir.mkdir(exist_ok=True)
-        
-        # Console handler
-        self._setup_console_handler()
-        
-        # File handler
-        self._setup_file_handler()
+        Path("logs").mkdir(exist_ok=True)
         
-        # Error file handler
-        self._setup_error_handler()
+        handlers = [
+            _console_handler(),  # Console handler
+            _file_handler(),     # File handler
+            _error_handler()     # Error file handler
+        ]
         
         # JSON handler (opsiyonel)
         if Settings.DEBUG:
-            self._setup_json_handler()
-    
-    def _setup_console_handler(self):
-        """Konsol çıktısı handler'ı"""
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
-        
-        # Platform kontrolü - Windows'da renk desteği
-        if sys.platform == "win32":
-            try:
-                import colorama
-                colorama.init()
-                formatter = ColoredFormatter(
-                    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                    datefmt='%H:%M:%S'
-                )
-            except ImportError:
-                formatter = logging.Formatter(
-                    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                    datefmt='%H:%M:%S'
-                )
-        else:
-            formatter = ColoredFormatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                datefmt='%H:%M:%S'
-            )
+            handlers.append(_json_handler())
         
-        console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
-    
-    def _setup_file_handler(self):
-        """Dosya çıktısı handler'ı"""
-        file_handler = logging.handlers.RotatingFileHandler(
-            Settings.LOG_FILE_PATH,
-            maxBytes=Settings.LOG_MAX_SIZE,
-            backupCount=Settings.LOG_BACKUP_COUNT,
-            encoding='utf-8'
-        )
-        file_handler.setLevel(logging.DEBUG)
-        
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(module)s:%(lineno)d - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
-    
-    def _setup_error_handler(self):
-        """Hata dosyası handler'ı"""
-        error_file = "logs/guard_errors.log"
-        error_handler = logging.handlers.RotatingFileHandler(
-            error_file,
-            maxBytes=5 * 1024 * 1024,  # 5MB
-            backupCount=3,
-            encoding='utf-8'
+        # Logger'a sadece kuyruk bağlanır; disk/konsol yazımı arka plan thread'inde yapılır
+        log_queue = queue.Queue(-1)
+        _queue_handler = _GuardQueueHandler(log_queue)
+        _listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
         )
-        error_handler.setLevel(logging.ERROR)
+        _listener.start()
         
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(module)s:%(lineno)d\n'
-            'Message: %(message)s\n'
-            'Function: %(funcName)s\n'
-            '%(pathname)s:%(lineno)d\n'
-            '%(exc_text)s\n' + '-'*50,
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        error_handler.setFormatter(formatter)
-        self.logger.addHandler(error_handler)
-    
-    def _setup_json_handler(self):
-        """JSON formatı handler'ı"""
-        json_file = "logs/guard_json.log"
-        json_handler = logging.handlers.RotatingFileHandler(
-            json_file,
-            maxBytes=10 * 1024 * 1024,  # 10MB
-            backupCount=2,
-            encoding='utf-8'
-        )
-        json_handler.setLevel(logging.DEBUG)
+        root_logger = logging.getLogger(_ROOT_LOGGER_NAME)
+        root_logger.setLevel(logging.DEBUG)
+        root_logger.addHandler(_queue_handler)
+
+def _stop_handlers():
+    """Kuyruktaki kayıtları yazar, arka plan thread'ini durdurur ve dosyaları kapatır"""
+    global _queue_handler, _listener
+    
+    with _handlers_lock:
+        listener, queue_handler = _listener, _queue_handler
+        if listener is None:
+            return
+        _listener = _queue_handler = None
+    
+    logging.getLogger(_ROOT_LOGGER_NAME).removeHandler(queue_handler)
+    listener.stop()
+    # Tampondaki (MemoryHandler) kayıtları boşalt ve dosyaları kapat
+    for handler in listener.handlers:
+        target = getattr(handler, 'target', None)
+        handler.close()
+        if target is not None:
+            target.close()
+
+atexit.register(_stop_handlers)
+
+class GuardLogger:
+    """Guard uygulaması için özel logger sınıfı"""
+    
+    def __init__(self, name: str = "guard"):
+        """Logger'ı başlatır"""
+        self.name = name
+        self.logger = logging.getLogger(_logger_name(name))
+        self.logger.setLevel(logging.DEBUG)
+        # Sık kullanılan stdlib metodları bir kez bağlanır (her log çağrısında attribute zinciri yok)
+        self._log = self.logger._log
+        self._is_enabled_for = self.logger.isEnabledFor
         
-        formatter = JsonFormatter()
-        json_handler.setFormatter(formatter)
-        self.logger.addHandler(json_handler)
+        # Ortak handler kümesi yalnızca ilk GuardLogger'da kurulur
+        # (dosyalar tekrar açılmaz, başka kodun eklediği handler'lar silinmez)
+        _start_handlers()
+    
+    def shutdown(self):
+        """Kuyruktaki kayıtları yazar ve arka plan thread'ini durdurur (tüm GuardLogger'lar için)"""
+        _stop_handlers()
     
     def debug(self, message: str, **kwargs):
         """Debug seviyesi log"""
-        self.logger.debug(message, extra=kwargs)
+        if self._is_enabled_for(logging.DEBUG):
+            self._log(logging.DEBUG, message, (), extra={'extras': kwargs})
     
     def info(self, message: str, **kwargs):
         """Info seviyesi log"""
-        self.logger.info(message, extra=kwargs)
+        if self._is_enabled_for(logging.INFO):
+            self._log(logging.INFO, message, (), extra={'extras': kwargs})
     
     def warning(self, message: str, **kwargs):
         """Warning seviyesi log"""
-        self.logger.warning(message, extra=kwargs)
+        if self._is_enabled_for(logging.WARNING):
+            self._log(logging.WARNING, message, (), extra={'extras': kwargs})
     
     def error(self, message: str, exc_info: bool = True, **kwargs):
         """Error seviyesi log"""
-        self.logger.error(message, exc_info=exc_info, extra=kwargs)
+        if self._is_enabled_for(logging.ERROR):
+            self._log(logging.ERROR, message, (), exc_info=exc_info, extra={'extras': kwargs})
     
     def critical(self, message: str, exc_info: bool = True, **kwargs):
         """Critical seviyesi log"""
-        self.logger.critical(message, exc_info=exc_info, extra=kwargs)
+        if self._is_enabled_for(logging.CRITICAL):
+            self._log(logging.CRITICAL, message, (), exc_info=exc_info, extra={'extras': kwargs})
     
     def exception(self, message: str, **kwargs):
         """Exception log (otomatik exc_info=True)"""
-        self.logger.exception(message, extra=kwargs)
+        if self._is_enabled_for(logging.ERROR):
+            self._log(logging.ERROR, message, (), exc_info=True, extra={'extras': kwargs})
     
     def log_function_call(self, func_name: str, args: tuple = None, kwargs: dict = None):
         """Fonksiyon çağrısını loglar"""
+        if not self._is_enabled_for(logging.DEBUG):
+            return
+        # args/kwargs JSON'da yapısal alan olarak 'extras' içinde taşınır; kuyruk handler'ı
+        # mesajı çağıran thread'de oluşturduğundan metne çevirme burada bir kez yapılır
         call_info = {
-            'function': func_name,
+            'called_function': func_name,
             'args': str(args) if args else None,
             'kwargs': str(kwargs) if kwargs else None
         }
-        self.debug(f"Function called: {func_name}", **call_info)
+        self._log(logging.DEBUG, "Function called: %s", (func_name,), extra={'extras': call_info})
     
-    def log_performance(self, operation: str, duration: float, **context):
+    def log_performance(self, operation: str, duration: float, duration_ms: float = None, **context):
         """Performans metriklerini loglar"""
-        perf_info = {
-            'operation': operation,
-            'duration_ms': round(duration * 1000, 2),
-            **context
-        }
-        self.info(f"Performance: {operation} took {duration:.3f}s", **perf_info)
+        if not self._is_enabled_for(logging.INFO):
+            return
+        # **context zaten çağrıya özel yeni bir sözlük; kopyalamadan doldurulur
+        context['operation'] = operation
+        context['duration_ms'] = duration_ms if duration_ms is not None else round(duration * 1000, 2)
+        self._log(logging.INFO, "Performance: %s took %.3fs", (operation, duration),
+                  extra={'extras': context})
     
     def log_user_action(self, user_id: str, action: str, **details):
         """Kullanıcı eylemlerini loglar"""
-        action_info = {
-            'user_id': user_id,
-            'action': action,
-            **details
-        }
-        self.info(f"User action: {action}", **action_info)
+        if not self._is_enabled_for(logging.INFO):
+            return
+        details['user_id'] = user_id
+        details['action'] = action
+        self._log(logging.INFO, "User action: %s", (action,), extra={'extras': details})
     
     def log_system_event(self, event_type: str, **details):
         """Sistem olaylarını loglar"""
-        event_info = {
-            'event_type': event_type,
-            **details
-        }
-        self.info(f"System event: {event_type}", **event_info)
+        if not self._is_enabled_for(logging.INFO):
+            return
+        details['event_type'] = event_type
+        self._log(logging.INFO, "System event: %s", (event_type,), extra={'extras': details})
 
 class PerformanceLogger:
     """Performans ölçümü için context manager"""
@@ -256,16 +490,18 @@ class PerformanceLogger:
         self.logger = logger
         self.operation = operation
         self.context = context
-        self.start_time = None
+        self.start_ns = None
     
     def __enter__(self):
-        self.start_time = datetime.now()
         self.logger.debug(f"Starting: {self.operation}")
+        # Monotonik, yüksek çözünürlüklü sayaç (datetime nesnesi oluşturulmaz)
+        self.start_ns = time.perf_counter_ns()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.start_time:
-            duration = (datetime.now() - self.start_time).total_seconds()
+        if self.start_ns is not None:
+            elapsed_ns = time.perf_counter_ns() - self.start_ns
+            duration = elapsed_ns / 1e9
             
             if exc_type:
                 self.logger.error(
@@ -274,7 +510,11 @@ class PerformanceLogger:
                     **self.context
                 )
             else:
-                self.logger.log_performance(self.operation, duration, **self.context)
+                self.logger.log_performance(
+                    self.operation, duration,
+                    duration_ms=elapsed_ns // 10_000 / 100,  # 2 ondalık basamaklı ms
+                    **self.context
+                )
 
 def setup_logging(log_level: str = None, enable_json: bool = False):
     """Global logging'i ayarlar"""
@@ -291,26 +531,25 @@ def setup_logging(log_level: str = None, enable_json: bool = False):
     logging.getLogger('firebase_admin').setLevel(logging.WARNING)
     logging.getLogger('google').setLevel(logging.WARNING)
     
-    return GuardLogger()
-
-# Global logger instance
-_guard_logger = None
+    return get_logger()
 
+# Global logger instance'ları (isim başına bir tane; hepsi 'guard' logger'ının handler'larını paylaşır)
+@functools.lru_cache(maxsize=None)
 def get_logger(name: str = "guard") -> GuardLogger:
     """Global logger instance'ını döndürür"""
-    global _guard_logger
-    if _guard_logger is None:
-        _guard_logger = GuardLogger(name)
-    return _guard_logger
+    return GuardLogger(name)
 
 def log_exception(logger: GuardLogger, message: str = "An error occurred"):
     """Exception decorator"""
     def decorator(func):
+        func_name = func.__name__
+        
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                logger.exception(f"{message} in {func.__name__}: {str(e)}")
+                logger.exception(f"{message} in {func_name}: {str(e)}")
                 raise
         return wrapper
     return decorator
@@ -318,37 +557,58 @@ def log_exception(logger: GuardLogger, message: str = "An error occurred"):
 def performance_monitor(logger: GuardLogger, operation_name: str = None):
     """Performans monitoring decorator"""
     def decorator(func):
+        # İşlem adı dekorasyon anında bir kez hesaplanır
+        op_name = operation_name or f"{func.__module__}.{func.__name__}"
+        
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            op_name = operation_name or f"{func.__module__}.{func.__name__}"
-            
             with PerformanceLogger(logger, op_name):
                 return func(*args, **kwargs)
         return wrapper
     return decorator
 
 # Yardımcı fonksiyonlar
+def _iter_log_entries(logs_dir: str = "logs"):
+    """Log dizinindeki '*.log*' dosyalarını DirEntry olarak döndürür (stat önbellekli)"""
+    with os.scandir(logs_dir) as entries:
+        for entry in entries:
+            if '.log' in entry.name and not entry.name.startswith('.') and entry.is_file():
+                yield entry
+
+def _unlink_quietly(path: str) -> bool:
+    """Dosyayı siler; silinemezse (ör. açık dosya) False döndürür"""
+    try:
+        os.unlink(path)
+        return True
+    except OSError:
+        return False
+
 def cleanup_old_logs(days: int = 30):
     """Eski log dosyalarını temizler"""
     try:
-        logs_dir = Path("logs")
-        if not logs_dir.exists():
+        if not os.path.isdir("logs"):
             return
         
         cutoff_time = datetime.now().timestamp() - (days * 24 * 60 * 60)
         
-        for log_file in logs_dir.glob("*.log*"):
-            if log_file.stat().st_mtime < cutoff_time:
-                log_file.unlink()
-                print(f"Eski log dosyası silindi: {log_file}")
+        # Silinecekler tek geçişte toplanır, unlink çağrıları paralel yapılır
+        to_remove = [entry.path for entry in _iter_log_entries()
+                     if entry.stat().st_mtime < cutoff_time]
+        if not to_remove:
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(8, len(to_remove))) as executor:
+            removed = sum(executor.map(_unlink_quietly, to_remove))
+        
+        logging.info(f"{removed} eski log dosyası silindi")
                 
     except Exception as e:
-        print(f"Log temizliği sırasında hata: {str(e)}")
+        logging.error(f"Log temizliği sırasında hata: {str(e)}")
 
 def get_log_stats() -> dict:
     """Log istatistiklerini döndürür"""
     try:
-        logs_dir = Path("logs")
-        if not logs_dir.exists():
+        if not os.path.isdir("logs"):
             return {"error": "Logs directory not found"}
         
         stats = {
@@ -357,15 +617,16 @@ def get_log_stats() -> dict:
             "files": []
         }
         
-        for log_file in logs_dir.glob("*.log*"):
-            file_size = log_file.stat().st_size
+        for entry in _iter_log_entries():
+            st = entry.stat()
+            file_size = st.st_size
             stats["total_files"] += 1
             stats["total_size_mb"] += file_size / (1024 * 1024)
             
             stats["files"].append({
-                "name": log_file.name,
+                "name": entry.name,
                 "size_mb": round(file_size / (1024 * 1024), 2),
-                "modified": datetime.fromtimestamp(log_file.stat().st_mtime).isoformat()
+                "modified": datetime.fromtimestamp(st.st_mtime).isoformat()
             })
         
         stats["total_size_mb"] = round(stats["total_size_mb"], 2)